@@ -11,6 +11,8 @@
 import sys
 import re
 import base64
+import threading
+import functools
 import markdown
 
 from PySide6.QtWidgets import (
@@ -19,9 +21,12 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import (
     QPixmap, QFont, QTextOption, QTextTable, QTextCursor, 
-    QAction, QIcon, QPainter, QColor, QResizeEvent
+    QAction, QIcon, QPainter, QColor, QResizeEvent, QTextDocument, QImageReader
+)
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QSize, QByteArray, QMimeData,
+    QObject, QRunnable, QThreadPool
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QSize, QByteArray, QMimeData
 
 from SaMPH_Utils.Utils import utils
 
@@ -47,13 +52,51 @@ md_converter = markdown.Markdown(extensions=[
     'codehilite': {'css_class': 'codehilite', 'noclasses': False, 'use_pygments': True}
 })
 
+#-----------------------------------------------------------------------------------------
+# Per-thread Markdown converter
+# markdown.Markdown keeps state between convert() calls, so the render workers in the
+# thread pool must not share the module-level instance with the UI thread
+#-----------------------------------------------------------------------------------------
+_md_local = threading.local()
+
+def get_thread_md_converter():
+    if threading.current_thread() is threading.main_thread():
+        return md_converter
+    converter = getattr(_md_local, "converter", None)
+    if converter is None:
+        converter = markdown.Markdown(extensions=[
+            'fenced_code', 'tables', 'nl2br', 'codehilite'
+        ], extension_configs={
+            'codehilite': {'css_class': 'codehilite', 'noclasses': False, 'use_pygments': True}
+        })
+        _md_local.converter = converter
+    return converter
+
 #-----------------------------------------------------------------------------------------
 # SVG Icon Generator
 # Generate a copy icon using a resource path
+# Cached: every bubble header and code-block overlay button shares one QIcon
 #-----------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
 def get_copy_icon():
     return QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-copy-chat-100.png"))
 
+#-----------------------------------------------------------------------------------------
+# Image preview loader
+# Decode an image file directly at a bounded size (the decoder scales while reading),
+# so photos are never held at full resolution just to be shown small
+#-----------------------------------------------------------------------------------------
+IMAGE_PREVIEW_SIZE = QSize(1200, 600)  # Bubbles show images at most ~cw x 300 px; 2x for HiDPI
+
+def load_scaled_image(path, max_size=IMAGE_PREVIEW_SIZE):
+    """Return a QImage of the file scaled to fit max_size (null QImage if unreadable)."""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and (size.width() > max_size.width() or size.height() > max_size.height()):
+        reader.setScaledSize(size.scaled(max_size, Qt.KeepAspectRatio))
+    return reader.read()
+
 #-----------------------------------------------------------------------------------------
 # Global CSS for rendering HTML content in the QTextBrowser
 #-----------------------------------------------------------------------------------------
@@ -101,6 +144,115 @@ HTML_WRAPPER = """
 </html>
 """
 
+#-----------------------------------------------------------------------------------------
+# LaTeX + Markdown Rendering
+# Pure function (no widget access) so it can run on a worker thread
+#-----------------------------------------------------------------------------------------
+def render_markdown_html(raw_text, bubble_width):
+    """
+    Handles LaTeX and Markdown rendering for AI messages.
+    Processes mathematical expressions, code blocks, and markdown formatting.
+    """
+    # [NEW] Remove <think> tags and their content
+    # This prevents internal reasoning from being displayed in the rendered output
+    text = re.sub(r'<think>.*?</think>\s*', '', raw_text, flags=re.DOTALL)
+    
+    # [CRITICAL FIX] Convert Unicode mathematical symbols to LaTeX first
+    # This ensures proper rendering of mathematical notation
+    text = unicode_to_latex(text)
+    
+    # Format list items and numbered lists for better markdown rendering
+    text = re.sub(r'([^\n])\n\s*-\s+', r'\1\n\n- ', text)
+    text = re.sub(r'(?m)^(\s*)(\d+)\.\s+(.*)', r'\1**\2.** \3', text)
+    
+    # Placeholder map for LaTeX expressions (block and inline)
+    ph_map = {}
+    ctr = 0
+    
+    def rep_blk(m):
+        """Replace block LaTeX expressions ($$...$$) with Base64 image placeholders."""
+        nonlocal ctr
+        k = f"MB{ctr}P"
+        ctr += 1
+        ph_map[k] = latex_to_base64_block(m.group(1).strip(), max_width_px=bubble_width*0.9)
+        return k
+    
+    def rep_inl(m):
+        """Replace inline LaTeX expressions ($...$) with MathML or Base64 image placeholders."""
+        nonlocal ctr
+        k = f"MI{ctr}P"
+        ctr += 1
+        latex_code = m.group(1).strip()
+        
+        # [CRITICAL FIX] If the expression contains superscripts (_) or subscripts (^), use image rendering
+        # This is because QTextBrowser cannot correctly display MathML's <msup> and <msub> elements
+        if '_' in latex_code or '^' in latex_code:
+            # inline=True: Use inline style to align with text
+            ph_map[k] = latex_to_base64_block(latex_code, font_size=11, dpi=120, max_width_px=400, inline=True)
+        else:
+            ph_map[k] = latex_to_mathml_inline(latex_code)
+        return k
+    
+    # Replace block LaTeX ($$...$$) and inline LaTeX ($...$) with placeholders
+    text = re.sub(r'\$\$([\s\S]*?)\$\$', rep_blk, text)
+    text = re.sub(r'(?<!\\)\$([^\$\n]+?)(?<!\\)\$', rep_inl, text)
+    
+    # Convert markdown to HTML
+    converter = get_thread_md_converter()
+    converter.reset()
+    html = converter.convert(text)
+    html = wrap_code_with_table(html)  # Wrap code blocks in tables for better styling
+    
+    # Replace placeholders with actual LaTeX renderings
+    for k, v in ph_map.items():
+        html = html.replace(k, v)
+    
+    return HTML_WRAPPER.format(content=html)
+
+#-----------------------------------------------------------------------------------------
+# Markup detection
+# Text matching none of these (Markdown, HTML, LaTeX, or Unicode math symbols that
+# unicode_to_latex would rewrite) renders identically as plain text
+#-----------------------------------------------------------------------------------------
+_MD_RE = re.compile(
+    r"[`*_#&\[\]$<>|\\~]|^\s*\d+\.|^\s*[-*+>]\s|^\s*={3,}|^\s*-{3,}"
+    r"|[\u00ac\u00b0-\u00b3\u00b9\u00d7\u00f7\u0370-\u03ff\u2070-\u209f\u2100-\u22ff]",
+    re.M
+)
+
+def is_plain_text(text):
+    """Return True if the text has no markup and can skip QTextDocument rendering."""
+    return bool(text) and not _MD_RE.search(text)
+
+#-----------------------------------------------------------------------------------------
+# Background Markdown Renderer
+# Runs render_markdown_html (Markdown, Pygments highlighting, LaTeX images) on the
+# global QThreadPool, keeping the UI thread free. Only the HTML string crosses threads;
+# the QTextDocument is built on the UI thread when the result is delivered.
+#-----------------------------------------------------------------------------------------
+class MarkdownRendererSignals(QObject):
+    finished = Signal(int, str)  # (render id, rendered HTML)
+
+
+class MarkdownRenderer(QRunnable):
+
+    def __init__(self, render_id, raw_text, bubble_width):
+        super().__init__()
+        self.render_id = render_id
+        self.raw_text = raw_text
+        self.bubble_width = bubble_width
+        self.signals = MarkdownRendererSignals()
+
+    def run(self):
+        try:
+            html = render_markdown_html(self.raw_text, self.bubble_width)
+        except Exception as e:
+            print(f"[Error] Markdown rendering failed: {e}")
+            html = f"<p>{self.raw_text}</p>"
+
+        self.signals.finished.emit(self.render_id, html)
+
+
 # ==================================================================================
 # SECTION 2: BUBBLE MESSAGE CLASS
 # ==================================================================================
@@ -142,8 +294,14 @@ class BubbleMessage(QWidget):
         self.bubble_width = int(self.available_width * self.fixed_ratio)
         self.image_labels = []
         self.text_edit = None
+        self.text_label = None     # Fast-path widget for markup-free messages
         self.overlay_buttons = [] # Store overlay buttons to manage memory
 
+        # Background rendering state: only the latest render id is applied
+        self._render_id = 0
+        self._render_jobs = {}
+        self._rendered_doc = None
+
         # Layout Setup
         self.outer_layout = QHBoxLayout(self)
         self.outer_layout.setContentsMargins(10, 6, 10, 6)
@@ -289,60 +447,7 @@ class BubbleMessage(QWidget):
         Handles LaTeX and Markdown rendering for AI messages.
         Processes mathematical expressions, code blocks, and markdown formatting.
         """
-        # [NEW] Remove <think> tags and their content
-        # This prevents internal reasoning from being displayed in the rendered output
-        text = re.sub(r'<think>.*?</think>\s*', '', raw_text, flags=re.DOTALL)
-        
-        # [CRITICAL FIX] Convert Unicode mathematical symbols to LaTeX first
-        # This ensures proper rendering of mathematical notation
-        text = unicode_to_latex(text)
-        
-        # Format list items and numbered lists for better markdown rendering
-        text = re.sub(r'([^\n])\n\s*-\s+', r'\1\n\n- ', text)
-        text = re.sub(r'(?m)^(\s*)(\d+)\.\s+(.*)', r'\1**\2.** \3', text)
-        
-        # Placeholder map for LaTeX expressions (block and inline)
-        ph_map = {}
-        ctr = 0
-        
-        def rep_blk(m):
-            """Replace block LaTeX expressions ($$...$$) with Base64 image placeholders."""
-            nonlocal ctr
-            k = f"MB{ctr}P"
-            ctr += 1
-            ph_map[k] = latex_to_base64_block(m.group(1).strip(), max_width_px=self.bubble_width*0.9)
-            return k
-        
-        def rep_inl(m):
-            """Replace inline LaTeX expressions ($...$) with MathML or Base64 image placeholders."""
-            nonlocal ctr
-            k = f"MI{ctr}P"
-            ctr += 1
-            latex_code = m.group(1).strip()
-            
-            # [CRITICAL FIX] If the expression contains superscripts (_) or subscripts (^), use image rendering
-            # This is because QTextBrowser cannot correctly display MathML's <msup> and <msub> elements
-            if '_' in latex_code or '^' in latex_code:
-                # inline=True: Use inline style to align with text
-                ph_map[k] = latex_to_base64_block(latex_code, font_size=11, dpi=120, max_width_px=400, inline=True)
-            else:
-                ph_map[k] = latex_to_mathml_inline(latex_code)
-            return k
-        
-        # Replace block LaTeX ($$...$$) and inline LaTeX ($...$) with placeholders
-        text = re.sub(r'\$\$([\s\S]*?)\$\$', rep_blk, text)
-        text = re.sub(r'(?<!\\)\$([^\$\n]+?)(?<!\\)\$', rep_inl, text)
-        
-        # Convert markdown to HTML
-        md_converter.reset()
-        html = md_converter.convert(text)
-        html = wrap_code_with_table(html)  # Wrap code blocks in tables for better styling
-        
-        # Replace placeholders with actual LaTeX renderings
-        for k, v in ph_map.items():
-            html = html.replace(k, v)
-        
-        return HTML_WRAPPER.format(content=html)
+        return render_markdown_html(raw_text, self.bubble_width)
     
     #-----------------------------------------------------------------------------
 
@@ -356,7 +461,14 @@ class BubbleMessage(QWidget):
         Provides standard text editing options with custom styling.
         """
         
-        menu = self.text_edit.createStandardContextMenu()
+        # Plain-text bubbles use a QLabel, which has no standard context menu
+        source = self.text_edit or self.text_label
+        if source is None:
+            return
+        if self.text_edit:
+            menu = self.text_edit.createStandardContextMenu()
+        else:
+            menu = self.createLabelContextMenu()
 
         menu.setContentsMargins(0,4,0,4)  # Left, Top, Right, Bottom
 
@@ -388,7 +500,23 @@ class BubbleMessage(QWidget):
         """)
 
         # Show the menu at the cursor position
-        menu.exec(self.text_edit.mapToGlobal(pos))
+        menu.exec(source.mapToGlobal(pos))
+
+    def createLabelContextMenu(self):
+        """Build the Copy / Select All menu for a plain-text QLabel bubble."""
+        label = self.text_label
+        menu = QMenu(self)
+
+        copy_action = menu.addAction("Copy")
+        copy_action.triggered.connect(
+            lambda: QApplication.clipboard().setText(label.selectedText() or label.text())
+        )
+
+        menu.addSeparator()
+
+        select_all_action = menu.addAction("Select All")
+        select_all_action.triggered.connect(lambda: label.setSelection(0, len(label.text())))
+        return menu
     
     #-----------------------------------------------------------------------------
 
@@ -401,27 +529,14 @@ class BubbleMessage(QWidget):
         """
         Create and configure the text display component for the bubble message.
         Handles both user messages (simple markdown) and AI messages (LaTeX + Markdown).
+        Messages without any markup take a fast path through a plain QLabel.
         """
-        self.text_edit = QTextBrowser()
-        self.text_edit.setReadOnly(True)
-        self.text_edit.setFrameStyle(QFrame.NoFrame)
-        self.text_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.text_edit.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.text_edit.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
-        
-        # Set font: Times New Roman (English), STFangsong (Chinese)
-        # This provides good readability for both English and Chinese text
-        font = QFont()
-        font.setFamilies(["Times New Roman", "STFangsong", "华文仿宋", "serif"])
-        font.setPointSize(11)
-        self.text_edit.setFont(font)
-        
-        self.text_edit.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
-        self.text_edit.setOpenExternalLinks(True)
+        if self.text != "Thinking..." and is_plain_text(self.text):
+            self.text_label = self.createTextLabel()
+            self.bubble_layout.addWidget(self.text_label)
+            return
 
-        # Configure custom context menu for right-click functionality
-        self.text_edit.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.text_edit.customContextMenuRequested.connect(self.show_context_menu_for_bubble)
+        self.text_edit = self.createTextEdit()
 
         # Render content based on message type
         if self.is_user:
@@ -433,18 +548,128 @@ class BubbleMessage(QWidget):
             # Special case: show plain text for "Thinking..." state
             self.text_edit.setPlainText(self.text)
         else:
-            # AI messages: full LaTeX and Markdown rendering
-            self.text_edit.setHtml(self.renderLocal(self.text))
+            # AI messages: show the raw text now, full LaTeX and Markdown rendering
+            # is done on the thread pool and swapped in when ready
+            self.text_edit.setPlainText(self.text)
+            self.startBackgroundRender()
 
-        # Apply transparent styling to blend with bubble background
-        self.text_edit.setStyleSheet("QTextBrowser {background: transparent; border: none; padding: 0;}")
         self.bubble_layout.addWidget(self.text_edit)
 
         # Install overlay button listeners for code block copy functionality
         self.installOverlayUpdate()
+
+    def createBubbleFont(self):
+        """Font: Times New Roman (English), STFangsong (Chinese)."""
+        # This provides good readability for both English and Chinese text
+        font = QFont()
+        font.setFamilies(["Times New Roman", "STFangsong", "华文仿宋", "serif"])
+        font.setPointSize(11)
+        return font
+
+    def createTextEdit(self):
+        """Create the QTextBrowser used for rich (Markdown/LaTeX) content."""
+        text_edit = QTextBrowser()
+        text_edit.setReadOnly(True)
+        text_edit.setUndoRedoEnabled(False)  # Read-only transcript, no undo stack needed
+        text_edit.setFrameStyle(QFrame.NoFrame)
+        text_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        text_edit.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        text_edit.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
+        text_edit.setFont(self.createBubbleFont())
+        
+        text_edit.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        text_edit.setOpenExternalLinks(True)
+
+        # Configure custom context menu for right-click functionality
+        text_edit.setContextMenuPolicy(Qt.CustomContextMenu)
+        text_edit.customContextMenuRequested.connect(self.show_context_menu_for_bubble)
+
+        # Apply transparent styling to blend with bubble background
+        text_edit.setStyleSheet("QTextBrowser {background: transparent; border: none; padding: 0;}")
+        return text_edit
+
+    def createTextLabel(self):
+        """Create the QLabel used for markup-free text (no QTextDocument needed)."""
+        label = QLabel(self.text)
+        label.setTextFormat(Qt.PlainText)
+        label.setWordWrap(True)
+        label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
+        label.setFont(self.createBubbleFont())
+
+        # Same custom right-click menu as the QTextBrowser bubbles
+        label.setContextMenuPolicy(Qt.CustomContextMenu)
+        label.customContextMenuRequested.connect(self.show_context_menu_for_bubble)
+
+        label.setStyleSheet("QLabel {background: transparent; border: none; padding: 4px; color: #24292f;}")
+        return label
+
+    def ensureTextEdit(self):
+        """
+        Swap a fast-path QLabel for a QTextBrowser when content must be rendered
+        as rich text (e.g. set_content or pre-rendered HTML on a plain bubble).
+        """
+        if self.text_edit:
+            return
+        self.text_edit = self.createTextEdit()
+        if self.text_label:
+            idx = self.bubble_layout.indexOf(self.text_label)
+            self.bubble_layout.insertWidget(max(idx, 0), self.text_edit)
+            self.bubble_layout.removeWidget(self.text_label)
+            self.text_label.deleteLater()
+            self.text_label = None
+        else:
+            self.bubble_layout.insertWidget(0, self.text_edit)
+        self.installOverlayUpdate()
     
     #-----------------------------------------------------------------------------
 
+    #-----------------------------------------------------------------------------
+    # Background Rendering
+    #-----------------------------------------------------------------------------
+    def startBackgroundRender(self):
+        """
+        Queue LaTeX/Markdown rendering of self.text on the global thread pool.
+        Earlier renders still in flight are superseded by the new render id.
+        """
+        self._render_id += 1
+        job = MarkdownRenderer(self._render_id, self.text, self.bubble_width)
+        job.signals.finished.connect(self.onBackgroundRenderFinished)
+        self._render_jobs[self._render_id] = job.signals  # Keep signals alive until delivery
+        QThreadPool.globalInstance().start(job)
+
+    def onBackgroundRenderFinished(self, render_id, html):
+        """
+        Install the HTML produced by MarkdownRenderer.
+        
+        Args:
+            render_id: The id the render was started with
+            html: The rendered HTML string
+        """
+        self._render_jobs.pop(render_id, None)
+        if render_id != self._render_id or not self.text_edit:
+            return
+
+        # Build the document on the UI thread, owned by the text browser;
+        # the transcript is read-only, so skip undo stack bookkeeping
+        doc = QTextDocument(self.text_edit)
+        doc.setUndoRedoEnabled(False)
+        doc.setDefaultFont(self.text_edit.font())
+        doc.setHtml(html)
+        self.text_edit.setDocument(doc)
+        self.text_edit.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        doc.contentsChanged.connect(lambda: QTimer.singleShot(50, self.updateOverlayButtons))
+
+        # Release the previously rendered document
+        if self._rendered_doc is not None:
+            self._rendered_doc.deleteLater()
+        self._rendered_doc = doc
+
+        self.calculateAndSetSize()
+        QTimer.singleShot(50, self.updateOverlayButtons)
+
+    #-----------------------------------------------------------------------------
+
     #-----------------------------------------------------------------------------
     # Add Image Components
     #-----------------------------------------------------------------------------
@@ -456,6 +681,7 @@ class BubbleMessage(QWidget):
         self.image_labels = []
         for img in self.images:
             pix = QPixmap()
+            image_path = None
             
             # Case 1: The input is already a QPixmap object
             if isinstance(img, QPixmap):
@@ -463,8 +689,13 @@ class BubbleMessage(QWidget):
             
             # Case 2: The input is a string (could be a file path or Base64)
             elif isinstance(img, str):
-                # A. Try loading as a regular file path first (e.g., "C:/images/photo.png")
-                if not pix.load(img):
+                # A. Try loading as a regular file path first (e.g., "C:/images/photo.png"),
+                #    decoded at preview size; the full file is re-read only for copying
+                image = load_scaled_image(img)
+                if not image.isNull():
+                    pix = QPixmap.fromImage(image)
+                    image_path = img
+                else:
                     # B. If loading as a path fails, it might be a Base64 string
                     try:
                         # 1. Clean the data: remove any data URI prefix (e.g., "data:image/png;base64,")
@@ -488,6 +719,7 @@ class BubbleMessage(QWidget):
             # Create label to display the image
             lbl = QLabel()
             lbl.setProperty("original_pixmap", pix)  # Store original for copying
+            lbl.setProperty("image_path", image_path)  # Full-resolution source, if loaded from a file
             lbl.setAlignment(Qt.AlignCenter)
 
             # Apply transparent background with padding for better visual appearance
@@ -542,6 +774,11 @@ class BubbleMessage(QWidget):
         # Handle copy action if user clicked "Copy Image"
         if action == copy_action:
             pixmap = label.property("original_pixmap")
+            image_path = label.property("image_path")
+            if image_path:
+                full_pixmap = QPixmap(image_path)
+                if not full_pixmap.isNull():
+                    pixmap = full_pixmap
             if pixmap and not pixmap.isNull():
                 QApplication.clipboard().setPixmap(pixmap)
                 self.flashCopyBtn("Image Copied!")  # Reuse the button's feedback effect
@@ -602,6 +839,9 @@ class BubbleMessage(QWidget):
                 self.text_edit.document().setTextWidth(cw)
                 h = int(self.text_edit.document().size().height()) + 5
                 self.text_edit.setFixedHeight(h)
+            elif self.text_label:
+                self.text_label.setFixedWidth(cw)
+                self.text_label.setFixedHeight(self.text_label.heightForWidth(cw))
         
         # Update widget geometry and emit signal
         self.adjustSize()
@@ -620,6 +860,7 @@ class BubbleMessage(QWidget):
             raw_text: The new text content to display
         """
         self.text = raw_text
+        self.ensureTextEdit()
         if self.text_edit:
             if self.is_user:
                 # User messages: simple markdown conversion
@@ -627,8 +868,13 @@ class BubbleMessage(QWidget):
                 html = md_converter.convert(self.text)
                 self.text_edit.setHtml(f"<style>p{{margin:0;}}</style>{html}")
             else:
-                # AI messages: full LaTeX and Markdown rendering
-                self.text_edit.setHtml(self.renderLocal(self.text))
+                # AI messages: show the reply as plain text right away (and size the
+                # bubble for it); the full LaTeX/Markdown render replaces it when the
+                # background job finishes
+                self.text_edit.setPlainText(self.text)
+                self.calculateAndSetSize()
+                self.startBackgroundRender()
+                return
             
             self.calculateAndSetSize()
             QTimer.singleShot(50, self.updateOverlayButtons)
@@ -641,6 +887,9 @@ class BubbleMessage(QWidget):
         Args:
             w: The new maximum width in pixels
         """
+        # Width unchanged: the bubble is already laid out for it, skip the relayout
+        if max(w, 100) == self.available_width:
+            return
         self.available_width = max(w, 100)
         self.bubble_width = int(self.available_width * self.fixed_ratio)
         self.bubble_widget.setFixedWidth(self.bubble_width)
@@ -656,8 +905,8 @@ class BubbleMessage(QWidget):
         Args:
             html_content: Pre-rendered HTML string to display
         """
-        if not self.text_edit:
-            return
+        self.ensureTextEdit()
+        self._render_id += 1  # Drop any background render still in flight
         self.text_edit.setHtml(html_content)
         self.text = self.text_edit.toPlainText()  # Sync text to avoid rendering issues
         self.calculateAndSetSize()
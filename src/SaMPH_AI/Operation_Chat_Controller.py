@@ -251,8 +251,13 @@ class Operation_Chat_Controller:
 
 
         self.current_chat_file = None
+        self.current_chat_item = None   # Side panel row of the open chat (search index entry)
         self.active_chat_path = None
         self.chat_history = []
+
+        # Encoded image Data URIs keyed by (path, mtime_ns, size): every send re-sends the
+        # whole history, so each attached file is read and Base64-encoded only once
+        self._image_uri_cache = {}
         
 
         # 2. Initialize Worker
@@ -263,6 +268,9 @@ class Operation_Chat_Controller:
         # 3. Connect Signals
         # worker.finished emits (reply_dict, bubble_widget)
         self.worker.finished.connect(self.on_ai_reply)
+
+        # Encode attached images while the user is still typing, not at send time
+        self.chat_window.image_attached.connect(self.get_image_data_uri)
         
         
         self.worker.start()
@@ -389,7 +397,7 @@ class Operation_Chat_Controller:
             json.dump(init_data, f, ensure_ascii=False, indent=2)
 
         self.current_chat_file = str(file_path)
-        self.side_panel.save_chat_to_folder(folder, title=init_data["title"])
+        self.current_chat_item = self.side_panel.save_chat_to_folder(folder, title=init_data["title"])
 
 
     # ---------------------------------------------------------
@@ -399,12 +407,21 @@ class Operation_Chat_Controller:
     # ========================================================================
     # Send Message to AI
     # ========================================================================
-    def send_message(self, text: str, images: list = None, show_user_message: bool = True):
+    def on_send_request(self, request):
+        """Slot for Right_AIChat_Panel.send_message_signal (carries a SendRequest)."""
+        self.send_message(
+            request.text, request.images, request.show_user,
+            skip_format_instruction=request.skip_format_instruction
+        )
+
+    def send_message(self, text: str, images: list = None, show_user_message: bool = True,
+                     skip_format_instruction: bool = False):
         """
         Send message to AI.
         :param text: Text content
         :param images: Image list (Base64 string list or file path list)
         :param show_user_message: If False, hides the user message bubble from the chat UI (but still sends to AI)
+        :param skip_format_instruction: If True, skip LaTeX rendering rules (for PDF report generation)
         """
         # 1. Modified validation: return only if no text AND no images
         # This allows users to send images without text
@@ -440,16 +457,9 @@ class Operation_Chat_Controller:
 
         QTimer.singleShot(0, self.update_all_bubbles_width)
         
-        # 5. Check if skip_format_instruction flag is set (for PDF report generation)
-        skip_format = getattr(self.chat_window, '_skip_format_instruction', False)
-        
-        # 6. Send to Worker with skip_format_instruction parameter
+        # 5. Send to Worker with skip_format_instruction parameter
         # Worker reads saved records via history_to_messages
-        self.worker.add_task(self.history_to_messages(skip_format_instruction=skip_format), ai_bubble)
-        
-        # 7. Reset the flag after use
-        if hasattr(self.chat_window, '_skip_format_instruction'):
-            self.chat_window._skip_format_instruction = False
+        self.worker.add_task(self.history_to_messages(skip_format_instruction=skip_format_instruction), ai_bubble)
         
         self.scroll_to_bottom()
 
@@ -540,6 +550,10 @@ class Operation_Chat_Controller:
                 )
             except Exception as e:
                 print(f"[ERR] Failed to write chat history: {e}")
+                return
+
+            # Make the new message findable from the history search box
+            self.side_panel.index_chat_record(self.current_chat_item, msg_data)
 
     # ... helper for images (unchanged) ...
     # ========================================================================
@@ -554,16 +568,20 @@ class Operation_Chat_Controller:
         if image_source.startswith("data:"):
             return image_source
 
-        # 2. If local file path, read file and convert
+        # 2. If local file path, read file and convert (cached until the file changes)
         path = Path(image_source)
         if path.is_file():
             try:
-                mime_type, _ = mimetypes.guess_type(path)
-                if not mime_type: mime_type = "image/png"  # Default fallback
-                
-                with open(path, "rb") as image_file:
-                    base64_encoded = base64.b64encode(image_file.read()).decode('utf-8')
-                    return f"data:{mime_type};base64,{base64_encoded}"
+                st = path.stat()
+                cache_key = (image_source, st.st_mtime_ns, st.st_size)
+                data_uri = self._image_uri_cache.get(cache_key)
+                if data_uri is None:
+                    mime_type, _ = mimetypes.guess_type(path)
+                    if not mime_type: mime_type = "image/png"  # Default fallback
+                    
+                    base64_encoded = base64.b64encode(path.read_bytes()).decode('utf-8')
+                    data_uri = self._image_uri_cache[cache_key] = f"data:{mime_type};base64,{base64_encoded}"
+                return data_uri
             except Exception as e:
                 print(f"[ERR] Failed to load image file: {e}")
                 return None
@@ -712,13 +730,12 @@ class Operation_Chat_Controller:
         except Exception as e:
             print(f"Failed to create new chat file: {e}")
 
-        self.side_panel.save_chat_to_folder(folder_name, title=chat_title, save_json=False)
+        self.current_chat_item = self.side_panel.save_chat_to_folder(folder_name, title=chat_title, save_json=False)
         self.side_panel.refresh_chat_list()
 
         # Adjust the chat input container position
         self.chat_window.messages_count = 0     # Update the message count in chat_window
-        self.chat_window.adjust_input_height()
-        self.chat_window.update_input_container_position()
+        self.chat_window.schedule_input_layout()
 
     # ========================================================================
     # Handle Opening Existing Chat File
@@ -736,6 +753,7 @@ class Operation_Chat_Controller:
             return
 
         self.current_chat_file = str(chat_file)
+        self.current_chat_item = self.side_panel.find_chat_item(folder, chat_title)
         self.chat_history = [] 
         self.chat_window.clear_all_messages()
 
@@ -753,6 +771,9 @@ class Operation_Chat_Controller:
             return
 
         w = max(100, self.scroll_area.viewport().width() - 40)
+
+        # Bubbles are collected and inserted in one batch (one relayout, one scroll)
+        bubbles = []
         
         for msg in messages:
             # 1. Parse basic fields
@@ -784,10 +805,9 @@ class Operation_Chat_Controller:
                 # Note: ai_logo might still use current default logo, or you can dynamically search logo by name
                 ai_logo=self.model_logo if role=="assistant" else None
             )
-            self.result_display.insertWidget(self.result_display.count()-1, bubble)
-
+            bubbles.append(bubble)
 
-        QTimer.singleShot(0, self.scroll_to_bottom)
+        self.chat_window.insert_message_widgets(bubbles)
 
         print(f"[INFO] Loaded chat '{chat_title}' from folder '{folder}'")
 
@@ -798,6 +818,6 @@ class Operation_Chat_Controller:
             self.chat_window.chat_line_edit.clear()
             self.chat_window.chat_line_edit.setFocus()
             self.chat_window.pending_images.clear()
-            self.chat_window.update_input_container_position()
+            self.chat_window.schedule_input_layout()
             
         QTimer.singleShot(20, self.update_all_bubbles_width)
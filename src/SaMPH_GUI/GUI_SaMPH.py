@@ -512,7 +512,7 @@ class GUI_SaMPH_Application(QMainWindow):     # Define the login window class, i
 
         # --- Connect signals from the right side panel ---
         # Chat signal
-        self.right_panel.send_message_signal.connect(self.operation_chat.send_message)
+        self.right_panel.connect_controller(self.operation_chat.on_send_request)
         
         # Chat message signals
         self.right_panel.new_chat_request.connect(self.operation_chat.handle_new_chat)
@@ -546,6 +546,11 @@ class GUI_SaMPH_Application(QMainWindow):     # Define the login window class, i
         #-----------------------------------------------------------------------
         if hasattr(self.setting_page, 'apply_settings_signal'):
             self.setting_page.apply_settings_signal.connect(self.operations_setting_page.apply_new_settings)
+        # Save/Apply feedback is shown transiently in the status bar instead of a modal box
+        if hasattr(self.setting_page, 'settings_page_operation_signal'):
+            self.setting_page.settings_page_operation_signal.connect(
+                lambda message: self.status_bar.showMessage(message, 2000)
+            )
 
     #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
@@ -8,6 +8,8 @@
 
 from pathlib import Path
 import json
+import functools
+import bisect
 from datetime import datetime
 import re
 
@@ -16,10 +18,14 @@ from PySide6.QtWidgets import (
     QLineEdit, QFrame, QMenu, QSizePolicy, QGraphicsOpacityEffect
 )
 from PySide6.QtCore import Qt, QSize, Signal, QEvent, QPropertyAnimation, QEasingCurve, QTimer, QPoint
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPainter, QColor
 from SaMPH_Utils.Utils import utils
 
 
+# Colors used at paint time (parsed once)
+_PANEL_BG = QColor("#f8f9fa")
+
+
 # ============================================================================
 # Utility helpers
 # ============================================================================
@@ -44,6 +50,96 @@ def sanitize_filename(name: str, max_len: int = 200) -> str:
     return cleaned
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_icon(icon_path: str) -> QIcon:
+    """Share one QIcon per icon file instead of reloading it for every row."""
+    return QIcon(icon_path)
+
+
+# ============================================================================
+# In-memory inverted index for chat search
+# ----------------------------------------------------------------------------
+# Maps normalized tokens to the ids of the chats containing them, so a query
+# is answered by intersecting posting sets instead of rescanning every chat.
+# CJK ideographs are indexed one character per token (they are not separated
+# by spaces), so any sub-phrase of a CJK title or message can be found.
+# ============================================================================
+_CJK = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_TOKEN_RE = re.compile(rf"[{_CJK}]|[^\W{_CJK}]+")
+
+def _token_list(text) -> list:
+    return _TOKEN_RE.findall(str(text).lower())
+
+def _tokenize(text) -> set:
+    return set(_token_list(text))
+
+
+class _Index:
+
+    def __init__(self):
+        self.postings = {}   # token   -> set of chat ids
+        self._keys = None    # sorted posting keys for prefix lookups, rebuilt lazily
+        self.texts = {}      # chat id -> indexed text (to find its tokens on remove)
+
+    def add(self, chat_id: int, text: str):
+        """Index (or extend the index of) one chat incrementally."""
+        self.texts[chat_id] = f"{self.texts.get(chat_id, '')}\n{text}".strip()
+        for token in _tokenize(text):
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                self._keys = None
+            ids.add(chat_id)
+
+    def remove(self, chat_id: int):
+        text = self.texts.pop(chat_id, None)
+        if text is None:
+            return
+        for token in _tokenize(text):
+            ids = self.postings.get(token)
+            if ids is not None:
+                ids.discard(chat_id)
+                if not ids:
+                    del self.postings[token]
+                    self._keys = None
+
+    def replace(self, chat_id: int, text: str):
+        self.remove(chat_id)
+        self.add(chat_id, text)
+
+    def _prefix_ids(self, prefix: str) -> set:
+        """Union of the postings of every token starting with prefix."""
+        if self._keys is None:
+            self._keys = sorted(self.postings)
+        keys = self._keys
+        ids = set()
+        i = bisect.bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            ids |= self.postings[keys[i]]
+            i += 1
+        return ids
+
+    def search(self, query: str):
+        """
+        Return the ids of chats containing every query token (None for an empty query).
+        The last token is matched as a prefix, since it may still be being typed.
+        """
+        tokens = _token_list(query)
+        if not tokens:
+            return None
+        last = tokens[-1]
+        postings = [self.postings.get(t, set()) for t in set(tokens[:-1])]
+        postings.append(self._prefix_ids(last))
+        # Intersect the smallest posting lists first
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
+
+
 # ============================================================================
 # Chat Item Widget
 # ============================================================================
@@ -68,7 +164,7 @@ class ChatItemWidget(QWidget):
         
         # Icon
         self.icon = QLabel()
-        self.icon.setPixmap(QIcon(icon_path).pixmap(16, 16))
+        self.icon.setPixmap(_cached_icon(icon_path).pixmap(16, 16))
         self.icon.setStyleSheet("background-color: transparent;")
         layout.addWidget(self.icon)
         
@@ -150,6 +246,12 @@ class ChatItemWidget(QWidget):
         self.parent_item.setData(Qt.UserRole, (self.folder_name, new_title))
         self.label.setText(new_title)
         
+        # Keep the search index in sync with the new title
+        side_panel = self.history_list.parent()
+        if hasattr(side_panel, "search_index") and hasattr(self.parent_item, "search_id"):
+            side_panel.search_index.replace(self.parent_item.search_id, new_title)
+            side_panel.index_chat_messages(self.parent_item, getattr(self.parent_item, "chat_messages", []))
+
         # Call parent callback (if any)
         try:
             # history_list -> ChatHistoryPanel
@@ -249,7 +351,7 @@ class CollapsibleFolder(QWidget):
         closed = utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-folder-100.png")
         opened = utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-opened-folder-100.png")
         icon_path = opened if self.is_expanded else closed
-        self.icon_label.setPixmap(QIcon(icon_path).pixmap(18, 18))
+        self.icon_label.setPixmap(_cached_icon(icon_path).pixmap(18, 18))
 
     # -------------------------------------------------------------------------
     # Inline rename workflow
@@ -375,7 +477,13 @@ class ChatHistoryPanel(QWidget):
         self.folders = {}
         self.chat_counter = 0
         self.folder_counter = 0
-        self.active_folder = None
+        self._active_folder = None
+        self._history_loaded = False   # Chat files are read on first use, not at startup
+
+        # Search index (chat id -> list item lookup lives next to it)
+        self.search_index = _Index()
+        self.search_items = {}
+        self.search_counter = 0
         
         # Storage
         self.storage_root = Path(storage_root)
@@ -447,18 +555,37 @@ class ChatHistoryPanel(QWidget):
         # Build UI
         self.init_ui()
         
-        # Load history
-        self.load_chat_history()
+        # History is loaded lazily (see ensure_history_loaded): parsing every chat
+        # file and building its row widget is deferred until the panel is first
+        # shown or its folder state is first needed
         
         # Initially hidden
         self.hide()
 
+    # -------------------------------------------------------------------------
+    # Lazy history loading
+    # -------------------------------------------------------------------------
+    def ensure_history_loaded(self):
+        """Load folders and chats from disk exactly once."""
+        if self._history_loaded:
+            return
+        self._history_loaded = True
+        self.load_chat_history()
+
+    @property
+    def active_folder(self):
+        self.ensure_history_loaded()
+        return self._active_folder
+
+    @active_folder.setter
+    def active_folder(self, name):
+        self._active_folder = name
+
     def paintEvent(self, event):
         """Manually paint background to ensure opacity"""
-        from PySide6.QtGui import QPainter, QColor
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QColor("#f8f9fa"))
+        painter.setBrush(_PANEL_BG)
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(self.rect(), 0, 0) # Draw solid background
         # Or if using border radius in stylesheet, just fill rect or let stylesheet handle it
@@ -505,6 +632,29 @@ class ChatHistoryPanel(QWidget):
         header_layout.addWidget(close_btn)
         
         layout.addWidget(header)
+
+        # Search box (debounced, filters the list through the inverted index)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search chats...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setStyleSheet("""
+            QLineEdit {
+                background-color: #ffffff;
+                border: 1px solid #dee2e6;
+                border-radius: 6px;
+                padding: 4px 8px;
+                margin: 0px 16px 6px 16px;
+                font-size: 13px;
+                color: #333;
+            }
+        """)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_search_filter)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        layout.addWidget(self.search_edit)
+
         layout.addWidget(self.create_divider())
         
         # Chat History List
@@ -555,6 +705,8 @@ class ChatHistoryPanel(QWidget):
         """Show panel with slide-down animation"""
         if self.is_visible or self.animation_in_progress:
             return
+
+        self.ensure_history_loaded()
         
         self.animation_in_progress = True
         
@@ -672,8 +824,7 @@ class ChatHistoryPanel(QWidget):
         if folder_name is None: return
         folder = self.folders[folder_name]
         folder["expanded"] = expanded
-        for chat_item in folder["items"]:
-            chat_item.setHidden(not expanded)
+        self.apply_search_filter()
     
     def on_chat_item_clicked(self,item):
         """Handle chat item click"""
@@ -717,6 +868,7 @@ class ChatHistoryPanel(QWidget):
 
     def save_chat_to_folder(self, folder_name, title=None, save_json=True):
         """Add chat to folder"""
+        self.ensure_history_loaded()
         folder = self.folders.get(folder_name)
         if not folder:
             self.create_folder(folder_name)
@@ -743,6 +895,12 @@ class ChatHistoryPanel(QWidget):
         self.history_list.setItemWidget(item, chat_widget)
         folder["items"].append(item)
         item.rename_chat_inline = chat_widget.start_rename
+
+        # Register the chat in the search index (title only; messages added on load)
+        self.search_counter += 1
+        item.search_id = self.search_counter
+        self.search_items[item.search_id] = item
+        self.search_index.add(item.search_id, chat_title)
         
         # Save JSON to disk
         if save_json:
@@ -867,6 +1025,7 @@ class ChatHistoryPanel(QWidget):
         Iterate through folders/chats and trigger lightweight repaints so custom
         widgets pick up any style or icon changes.
         """
+        self.ensure_history_loaded()
         for folder_name, folder in self.folders.items():
 
             folder["widget"].update_icon()  # update folder icon
@@ -920,11 +1079,75 @@ class ChatHistoryPanel(QWidget):
                     item = self.save_chat_to_folder(folder_name, title=chat_title, save_json=False)
                     # optionally attach loaded messages to the item for later display
                     item.chat_messages = messages
+                    self.index_chat_messages(item, messages)
                     print(f"[INFO] Loaded chat: {chat_title} ({len(messages)} messages)")
 
                 except Exception as e:
                     print(f"[ERROR] Failed to load {chat_file}: {e}")
 
+        self.apply_search_filter()
+
+
+    # =========================================================================
+    # Chat search (inverted index)
+    # =========================================================================
+    def index_chat_messages(self, item, messages):
+        """
+        Add the text of the given messages to the search index entry of a chat item.
+        """
+        chat_id = getattr(item, "search_id", None)
+        if chat_id is None:
+            return
+        texts = [m.get("text", "") for m in messages if isinstance(m, dict) and m.get("text")]
+        if texts:
+            self.search_index.add(chat_id, "\n".join(texts))
+
+    def index_chat_record(self, item, message):
+        """
+        Index one message just saved by the chat controller, so chats created or
+        continued in this session are searchable by their new messages too.
+        """
+        chat_id = getattr(item, "search_id", None)
+        if chat_id is None or self.search_items.get(chat_id) is not item:
+            return  # Unknown or deleted chat row
+        if not hasattr(item, "chat_messages"):
+            item.chat_messages = []
+        item.chat_messages.append(message)  # Re-indexed on rename
+        self.index_chat_messages(item, [message])
+        if self.search_edit.text().strip():
+            self.apply_search_filter()
+
+    def find_chat_item(self, folder_name, chat_title):
+        """Return the list item of a chat by folder and title (None if not listed)."""
+        folder = self.folders.get(folder_name)
+        if not folder:
+            return None
+        for chat_item in folder["items"]:
+            data = chat_item.data(Qt.UserRole)
+            if data and tuple(data) == (folder_name, chat_title):
+                return chat_item
+        return None
+
+    def apply_search_filter(self):
+        """
+        Show only the chats matching the search box query. Folders stay visible
+        when they contain a match; with an empty query the folder expanded state
+        decides visibility again.
+        """
+        query = self.search_edit.text() if hasattr(self, "search_edit") else ""
+        matches = self.search_index.search(query)
+
+        for folder in self.folders.values():
+            any_visible = False
+            for chat_item in folder["items"]:
+                if matches is None:
+                    visible = folder["expanded"]
+                else:
+                    visible = getattr(chat_item, "search_id", None) in matches
+                chat_item.setHidden(not visible)
+                any_visible = any_visible or visible
+            folder["item"].setHidden(matches is not None and not any_visible)
+
 
     # =========================================================================
     # Disk rename helper — main fix point
@@ -1022,6 +1245,7 @@ class ChatHistoryPanel(QWidget):
         Create a brand-new folder both in the UI list and on disk, then mark it
         as the active folder for immediate use.
         """
+        self.ensure_history_loaded()
         self.folder_counter += 1
         folder_name = f"New folder {self.folder_counter}"
         self.create_folder(folder_name)
@@ -1075,6 +1299,7 @@ class ChatHistoryPanel(QWidget):
 
         # remove all chat items under the folder
         for chat_item in folder["items"]:
+            self.forget_search_item(chat_item)
             self.history_list.takeItem(self.history_list.row(chat_item))
         # remove folder header
         self.history_list.takeItem(self.history_list.row(folder["item"]))
@@ -1092,6 +1317,14 @@ class ChatHistoryPanel(QWidget):
         if self.active_folder == folder_name:
             self.active_folder = list(self.folders.keys())[-1] if self.folders else None
 
+    # -------------------------------------------------------------------------
+    def forget_search_item(self, item):
+        """Drop a chat item from the search index."""
+        chat_id = getattr(item, "search_id", None)
+        if chat_id is not None:
+            self.search_index.remove(chat_id)
+            self.search_items.pop(chat_id, None)
+
     # -------------------------------------------------------------------------
     # Delete Chat
     # -------------------------------------------------------------------------
@@ -1104,6 +1337,7 @@ class ChatHistoryPanel(QWidget):
         if not folder or item not in folder["items"]:
             return
         folder["items"].remove(item)
+        self.forget_search_item(item)
         self.history_list.takeItem(self.history_list.row(item))
 
         # Delete JSON file on disk
@@ -1131,3 +1365,6 @@ class ChatHistoryPanel(QWidget):
         title_labels = self.findChildren(QLabel)
         if title_labels:
             title_labels[0].setText(lang_manager.get_text("Chat History"))
+
+        # Update search placeholder
+        self.search_edit.setPlaceholderText(lang_manager.get_text("Search chats..."))
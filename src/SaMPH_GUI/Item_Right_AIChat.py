@@ -7,31 +7,198 @@
 #-------------------------------------------------------------- 
 
 import sys
-import os
+import re
+import json
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QToolButton,
     QTextEdit, QScrollArea, QFrame, QSizePolicy, QComboBox, QFileDialog,
-    QGraphicsDropShadowEffect, QAbstractItemView
+    QAbstractItemView
 )
-from PySide6.QtCore import Qt, QSize, Signal, QPropertyAnimation, QEvent, QDateTime, QTimer
-from PySide6.QtGui import QIcon, QTextImageFormat, QTextCursor, QColor
+from PySide6.QtCore import (
+    Qt, QSize, QRect, QUrl, Signal, QPropertyAnimation, QParallelAnimationGroup, QEvent, QTimer
+)
+from PySide6.QtGui import (
+    QIcon, QTextImageFormat, QTextCursor, QColor, QStandardItemModel, QStandardItem,
+    QPixmap, QPainter, QTextDocument
+)
+
+# Package root (.../src), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 # Add the parent directory to the Python path for debugging
 if __name__ == "__main__": 
     print("Debug mode!")   
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if project_root not in sys.path: 
-        sys.path.insert(0, project_root)
+    if str(PROJECT_ROOT) not in sys.path: 
+        sys.path.insert(0, str(PROJECT_ROOT))
 
 
 
 
 from SaMPH_Utils.Utils import utils
-from SaMPH_AI.Operation_Bubble_Message import BubbleMessage
+from SaMPH_AI.Operation_Bubble_Message import BubbleMessage, load_scaled_image
 from SaMPH_GUI.Item_AIChatHistoryPanel import ChatHistoryPanel
 
+# Optional faster JSON parser for account.json (falls back to the standard library)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Icon directory, resolved once at import instead of per widget
+ICON_DIR = Path(utils.local_resource_path("SaMPH_Images/WIN11-Icons"))
+
+# Shared icons: each file is decoded once per process, icons are immutable and safe to share
+@lru_cache(maxsize=128)
+def _cached_icon(icon_name):
+    return QIcon(str(ICON_DIR / icon_name))
+
+@lru_cache(maxsize=128)
+def _icon_exists(icon_name):
+    return (ICON_DIR / icon_name).exists()
+
+# Colors reused across instances (parsed once)
+_SHADOW_COLOR = QColor(0, 0, 0, 40)
+
+# 9-slice shadow geometry: transparent margin around a rounded card
+_SHADOW_MARGIN = 20
+_SHADOW_RADIUS = 16
+_SHADOW_OFFSET = 5   # Shadow is shifted down, like the old drop-shadow offset
+
+@lru_cache(maxsize=1)
+def _shadow_pixmap():
+    """
+    Pre-render the soft shadow once (needs a QApplication, hence lazy).
+    Stacked rounded rects with a small alpha approximate the gaussian falloff.
+    """
+    size = 2 * (_SHADOW_MARGIN + _SHADOW_RADIUS) + 2  # 2 px stretchable center slice
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    step_color = QColor(_SHADOW_COLOR)
+    step_color.setAlpha(max(1, _SHADOW_COLOR.alpha() // 16))
+    painter.setBrush(step_color)
+    for step in range(_SHADOW_MARGIN, 0, -1):
+        rect = QRect(0, 0, size, size).adjusted(
+            _SHADOW_MARGIN - step, _SHADOW_MARGIN - step,
+            step - _SHADOW_MARGIN, step - _SHADOW_MARGIN
+        )
+        painter.drawRoundedRect(rect, _SHADOW_RADIUS + step, _SHADOW_RADIUS + step)
+    painter.end()
+    return pixmap
+
+
+#==============================================================
+class ShadowUnderlay(QWidget):
+    """
+    Paints a pre-rendered 9-slice shadow behind a floating widget.
+    Replaces QGraphicsDropShadowEffect, which re-renders and blurs the
+    target offscreen on every paint. Follows the target's geometry.
+    """
+
+    def __init__(self, target, parent=None):
+        super().__init__(parent)
+        self.target = target
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        target.installEventFilter(self)
+        self.sync_to_target()
+
+    def eventFilter(self, obj, event):
+        if obj is self.target:
+            if event.type() in (QEvent.Move, QEvent.Resize):
+                self.sync_to_target()
+            elif event.type() == QEvent.Show:
+                self.show()
+                self.sync_to_target()
+            elif event.type() == QEvent.Hide:
+                self.hide()
+        return super().eventFilter(obj, event)
+
+    def sync_to_target(self):
+        m = _SHADOW_MARGIN
+        self.setGeometry(self.target.geometry().adjusted(-m, -m + _SHADOW_OFFSET, m, m + _SHADOW_OFFSET))
+        self.stackUnder(self.target)
+
+    def paintEvent(self, event):
+        pixmap = _shadow_pixmap()
+        # Slice borders: margin + corner radius on each side, the rest stretches
+        b = _SHADOW_MARGIN + _SHADOW_RADIUS
+        pw, ph = pixmap.width(), pixmap.height()
+        w, h = self.width(), self.height()
+        if w < 2 * b or h < 2 * b:
+            return
+
+        xs_src = [(0, b), (b, pw - 2 * b), (pw - b, b)]
+        ys_src = [(0, b), (b, ph - 2 * b), (ph - b, b)]
+        xs_dst = [(0, b), (b, w - 2 * b), (w - b, b)]
+        ys_dst = [(0, b), (b, h - 2 * b), (h - b, b)]
+
+        painter = QPainter(self)
+        for (sy, sh), (dy, dh) in zip(ys_src, ys_dst):
+            for (sx, sw), (dx, dw) in zip(xs_src, xs_dst):
+                if sw > 0 and sh > 0 and dw > 0 and dh > 0:
+                    painter.drawPixmap(QRect(dx, dy, dw, dh), pixmap, QRect(sx, sy, sw, sh))
+        painter.end()
+
+
+#==============================================================
+@dataclass(frozen=True, slots=True)
+class SendRequest:
+    """Payload of send_message_signal: one slots-backed object instead of three boxed arguments."""
+    text: str
+    images: list
+    show_user: bool = True  # False hides the user bubble (message is still sent)
+    skip_format_instruction: bool = False  # True omits the LaTeX format rules (PDF report prompts)
+
+
+#==============================================================
+class ChatInputEdit(QTextEdit):
+    """
+    Chat input box that coalesces per-keystroke textChanged notifications
+    into a single input_settled signal once typing pauses, and turns
+    Enter into send_requested (Shift+Enter inserts a newline).
+    """
+
+    input_settled  = Signal(str)  # Emit the current text after a short idle period
+    send_requested = Signal()     # Enter pressed without Shift
+
+    def __init__(self, parent=None, settle_ms=50):
+        super().__init__(parent)
+
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(settle_ms)
+        self._settle_timer.timeout.connect(self._emit_settled)
+
+        self.textChanged.connect(self._on_text_changed)
+
+    def _on_text_changed(self):
+        # Only arm the timer once per idle quantum
+        if not self._settle_timer.isActive():
+            self._settle_timer.start()
+
+    def _emit_settled(self):
+        self.input_settled.emit(self.toPlainText())
+
+    def keyPressEvent(self, event):
+        # Handled here rather than through an event filter, which would see every event
+        if event.key() in (Qt.Key_Enter, Qt.Key_Return):
+            if event.modifiers() & Qt.ShiftModifier:
+                # Shift+Enter: insert newline
+                self.insertPlainText("\n")
+            else:
+                # Enter: send message
+                self.send_requested.emit()
+            return
+        super().keyPressEvent(event)
 
 
 #==============================================================
@@ -41,13 +208,14 @@ class Right_AIChat_Panel(QWidget):
     """
     
     # Signals
-    send_message_signal = Signal(str, list, bool)  # Emit when user sends a message (text, images, show_user_message)
+    send_message_signal = Signal(object)  # Emit a SendRequest when user sends a message; connect via connect_controller
 
     show_chathistory_panel_requested = Signal()
     model_changed_signal             = Signal(str, QIcon)  # Send the new model name
 
     new_chat_request          = Signal()
     new_folder_request        = Signal()
+    image_attached            = Signal(str)  # Path of an image added to pending_images
 
 
     def __init__(self, parent=None):
@@ -63,19 +231,63 @@ class Right_AIChat_Panel(QWidget):
         self.pending_images = []
         self.messages_count = 0 # Track message count for positioning
         
-        # Debounce for Enter key
-        self._last_send_time = 0
+        # Throttle for Enter key: a send starts the timer, further Enters are ignored while it runs
         self._send_debounce_ms = 300
+        self._send_timer = QTimer(self)
+        self._send_timer.setSingleShot(True)
+        self._send_timer.setInterval(self._send_debounce_ms)
 
         # Input box configuration - Increase height for better visual breathing room
         self.input_min_height = 120  # Minimum height (px) - Increased to avoid crowding
         self.input_max_height = 220  # Maximum height (px) - Allows more text input
+
+        # Cached input document height, keyed on (document revision, viewport width)
+        self._last_doc_key = (None, None)
+        self._last_doc_height = 0
+
+        # Off-screen document used only for measuring the input text height,
+        # so measuring never forces a layout on the live (painted) editor document
+        self._measure_doc = QTextDocument(self)
+        self._measure_doc.setUndoRedoEnabled(False)
         
         # Language manager (will be set by main window)
         self.lang_manager = None
+
+        # Translations already resolved for the active (manager, language); see _t
+        self._i18n_cache = {}
+        self._i18n_key = None
+
+        # Model list refresh requested while the panel was hidden/collapsed
+        self._pending_model_refresh = False
+
+        # Parsed account.json, keyed by its modification time (st_mtime_ns)
+        self._ai_config_cache = {"mtime": None, "value": None}
+
+        # Coalesce resize-driven layout work into one update per frame (~16 ms)
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(16)
+        self._layout_timer.timeout.connect(self._do_layout_update)
+
+        # Coalesce input height/position requests (typing, image insert, send) into one pass
+        self._adjust_timer = QTimer(self)
+        self._adjust_timer.setSingleShot(True)
+        self._adjust_timer.setInterval(10)
+        self._adjust_timer.timeout.connect(self._do_adjust_input_layout)
+
+        # One pending scroll-to-bottom job at a time (see request_scroll_to_bottom)
+        self._scroll_pending = False
+
+        # Floating input is first positioned in showEvent; later shows only
+        # redo the layout if a resize was skipped while the panel was hidden
+        self._initial_layout_done = False
+        self._layout_stale = False
         
         # Initialize UI
         self.init_ui()
+
+        # Collapse/expand animation, built once and reused by toggle_panel
+        self._build_toggle_animation()
         
 
 
@@ -89,6 +301,9 @@ class Right_AIChat_Panel(QWidget):
         self.setMinimumWidth(400)
         self.setMaximumWidth(800)
         # self.setFixedWidth(self.panel_width) # Optional: fixed width
+
+        # Panel-wide stylesheet, children are styled by objectName
+        self.setStyleSheet(self._STYLESHEET)
         
         # Main layout (Background layer)
         self.main_layout = QVBoxLayout(self)
@@ -98,38 +313,27 @@ class Right_AIChat_Panel(QWidget):
         # ============ 1. Header Section ============
         header = QWidget()
         header.setFixedHeight(50)
-        header.setStyleSheet("background-color: #f8f9fa;")
+        header.setObjectName("ChatHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(15, 0, 15, 0)
         
         # Title label
-        title_label = QLabel("AI Assistant")
-        title_label.setStyleSheet("font-weight: bold; font-size: 15px; color: #333;")
-        header_layout.addWidget(title_label)
+        self.title_label = QLabel("AI Assistant")
+        self.title_label.setObjectName("ChatTitle")
+        header_layout.addWidget(self.title_label)
 
 
         header_layout.addStretch()
 
         # Hide button
         self.btn_chathistory_panel = QPushButton()
-        self.btn_chathistory_panel.setIcon(QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-order-history-100.png")))
+        self.btn_chathistory_panel.setIcon(_cached_icon("icons8-order-history-100.png"))
         self.btn_chathistory_panel.setIconSize(QSize(24, 24))
         self.btn_chathistory_panel.setFixedWidth(32)
         self.btn_chathistory_panel.setFixedHeight(32)
         self.btn_chathistory_panel.setCursor(Qt.PointingHandCursor)
         self.btn_chathistory_panel.setToolTip("Show/Hide Chat History")
-        self.btn_chathistory_panel.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-            }
-            QPushButton:hover { 
-                background-color: #F0F0F0;  /* Hover color */ 
-            }
-            QPushButton:pressed { 
-                background-color: #005a9e;   /* Pressed color */ 
-            }
-        """)
+        self.btn_chathistory_panel.setObjectName("ChatHeaderBtn")
 
 
 
@@ -146,11 +350,12 @@ class Right_AIChat_Panel(QWidget):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setFrameShape(QFrame.NoFrame)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet("background: transparent;")
+        self.scroll_area.setObjectName("ChatScrollArea")
+        self._vscroll = self.scroll_area.verticalScrollBar()  # Fetched once, reused by _scroll_to_bottom
         
         # Chat container (Vertical Layout for bubbles)
         self.chat_container = QWidget()
-        self.chat_container.setStyleSheet("background-color: #f4f6f9;")
+        self.chat_container.setObjectName("ChatContainer")
         self.result_layout = QVBoxLayout(self.chat_container)
         self.result_layout.setAlignment(Qt.AlignTop)
         self.result_layout.setSpacing(15)
@@ -162,7 +367,7 @@ class Right_AIChat_Panel(QWidget):
         # pushing the last message up so the floating input doesn't cover it.
         self.bottom_buffer = QWidget()
         self.bottom_buffer.setFixedHeight(220) # Initial buffer size
-        self.bottom_buffer.setStyleSheet("background: transparent;")
+        self.bottom_buffer.setObjectName("ChatBottomBuffer")
         
         self.result_layout.addWidget(self.bottom_buffer)
         
@@ -173,29 +378,24 @@ class Right_AIChat_Panel(QWidget):
         # Important: Parent is self, NOT added to main_layout
         self.input_container = QFrame(self)
         self.input_container.setObjectName("FloatingInput")
-        self.input_container.setStyleSheet("""
-            QFrame#FloatingInput {
-                background-color: #FFFFFF;
-                border-radius: 16px;
-                border: 1px solid #e0e0e0;
-            }
-        """)
-        
-        # Add Shadow
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        shadow.setOffset(0, 5)
-        self.input_container.setGraphicsEffect(shadow)
+        
+        # Add Shadow (static 9-slice pixmap underneath, no per-paint blur)
+        self.input_shadow = ShadowUnderlay(self.input_container, self)
 
         # Build the internal 3-part layout
         self.setup_input_layout()
+
+        # Tooltip translation keys, built once for update_ui_texts
+        self._tooltip_keys = {
+            self.btn_new_chat:          "New chat",
+            self.btn_history:           "Chat history",
+            self.btn_new_folder:        "New folder",
+            self.btn_chathistory_panel: "Show/Hide Chat History",
+        }
         
         # *** CRITICAL FIX: Initial positioning ***
-        # We need to delay the positioning until after the widget is fully shown
+        # Positioning is deferred to the first showEvent (see _initial_layout_done)
         # Otherwise the container will appear at (0,0) initially
-        QTimer.singleShot(0, self.update_input_container_position)
-        QTimer.singleShot(50, self.adjust_input_height)
 
 
 
@@ -232,16 +432,7 @@ class Right_AIChat_Panel(QWidget):
         """Create a modern, subtle divider line"""
         line = QFrame()
         line.setFixedHeight(2)
-        line.setStyleSheet("""
-            QFrame {
-                background-color: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(0, 0, 0, 25),
-                    stop:0.5 rgba(0, 0, 0, 45),
-                    stop:1 rgba(0, 0, 0, 25)
-                );
-            }
-        """)
+        line.setObjectName("ChatDivider")
         return line
 
 
@@ -261,12 +452,12 @@ class Right_AIChat_Panel(QWidget):
         top_layout.setSpacing(12)  # Increase spacing between buttons
         
         # Helper to create styled small buttons
-        def create_icon_btn(icon_path, tooltip):
+        def create_icon_btn(icon_name, tooltip):
 
             btn = QPushButton()
             # Use icon if exists, else text for debug
-            if os.path.exists(utils.local_resource_path(icon_path)):
-                btn.setIcon(QIcon(utils.local_resource_path(icon_path)))
+            if _icon_exists(icon_name):
+                btn.setIcon(_cached_icon(icon_name))
             else:
                 btn.setText(tooltip[0]) # First letter fallback
             
@@ -274,22 +465,19 @@ class Right_AIChat_Panel(QWidget):
             btn.setFixedSize(28, 28)
             btn.setToolTip(tooltip)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet("""
-                QPushButton { border: none; border-radius: 4px; background: transparent; }
-                QPushButton:hover { background-color: #f0f0f0; }
-            """)
+            btn.setObjectName("ChatIconBtn")
             return btn
 
         self.btn_history = create_icon_btn(
-            "SaMPH_Images/WIN11-Icons/icons8-order-history-100.png", 
+            "icons8-order-history-100.png", 
             "Chat history"
         )
         self.btn_new_folder = create_icon_btn(
-            "SaMPH_Images/WIN11-Icons/icons8-folder-100.png", 
+            "icons8-folder-100.png", 
             "New folder"
         )
         self.btn_new_chat = create_icon_btn(
-            "SaMPH_Images/WIN11-Icons/icons8-computer-chat-100.png", 
+            "icons8-computer-chat-100.png", 
             "New chat"
         )
         
@@ -307,7 +495,7 @@ class Right_AIChat_Panel(QWidget):
         layout.addLayout(top_layout)
 
         # ---- ROW 2: Text Input (Chat Line Edit) ----
-        self.chat_line_edit = QTextEdit()
+        self.chat_line_edit = ChatInputEdit()
         self.chat_line_edit.setPlaceholderText("Ask anything...")
         self.chat_line_edit.setFrameShape(QFrame.NoFrame)
         
@@ -319,21 +507,14 @@ class Right_AIChat_Panel(QWidget):
         self.chat_line_edit.setMinimumHeight(30)  # Minimum height: single line text
         self.chat_line_edit.setMaximumHeight(120)  # Maximum height: prevent taking up too much space
         
-        self.chat_line_edit.setStyleSheet("""
-            QTextEdit {
-                background: transparent;
-                font-size: 14px;
-                color: #333;
-                selection-background-color: #0078d4;
-            }
-        """)
+        self.chat_line_edit.setObjectName("ChatInput")
         self.chat_line_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         
         # *** Critical Optimization: Do not connect textChanged directly ***
-        # Text change naturally triggers resizeEvent, avoiding frequent updates
-        # self.chat_line_edit.textChanged.connect(self.adjust_input_height)  # Connection removed
+        # Per-keystroke signals are coalesced by ChatInputEdit; resize once typing settles
+        self.chat_line_edit.input_settled.connect(lambda _text: self.schedule_input_layout())
         
-        self.chat_line_edit.installEventFilter(self) # For Shift+Enter
+        self.chat_line_edit.send_requested.connect(self.on_enter_pressed) # Enter sends, Shift+Enter is handled by the edit
         
         layout.addWidget(self.chat_line_edit)
 
@@ -343,21 +524,12 @@ class Right_AIChat_Panel(QWidget):
 
         # Insert Image
         self.btn_insert_image = QPushButton()
-        self.btn_insert_image.setIcon(QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-add-image-100.png")))
+        self.btn_insert_image.setIcon(_cached_icon("icons8-add-image-100.png"))
         self.btn_insert_image.setIconSize(QSize(20, 20))
         self.btn_insert_image.setFixedSize(32, 32)
         self.btn_insert_image.setCursor(Qt.PointingHandCursor)
         self.btn_insert_image.clicked.connect(self.insert_image)
-        self.btn_insert_image.setStyleSheet("""
-            QPushButton { 
-                border: 1px solid #aaaaaa;
-                border-radius: 6px; 
-                background: transparent; 
-            }
-            QPushButton:hover { 
-                background-color: #f0f0f0; 
-            }
-        """)
+        self.btn_insert_image.setObjectName("ChatImageBtn")
         bot_layout.addWidget(self.btn_insert_image)
 
         #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -365,49 +537,20 @@ class Right_AIChat_Panel(QWidget):
         # ComboBox: AI Engine selection
         self.AI_engine_box = QComboBox()
 
+        # Back the combobox with a model so refreshes replace all rows in one batch
+        self.AI_engine_model = QStandardItemModel(self)
+        self.AI_engine_box.setModel(self.AI_engine_model)
+        self.AI_engine_box.setModelColumn(0)
+
         # Connect the combobox selection change signal to the corresponding slot
         self.AI_engine_box.currentIndexChanged.connect(self.emit_model_changed)
 
-        # Set style for the combobox
-        arrow_path = utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-expand-arrow-100.png")
-
-        print(f"[DEBUG] Loading arrow from: {arrow_path}")
-
-        arrow_path = arrow_path.replace("\\", "/")
-        self.AI_engine_box.setStyleSheet(f"""
-            QComboBox {{
-                border: 1px solid #aaaaaa;
-                border-radius: 8px;
-                padding: 2px 0px 2px 0px;
-                min-width: 6em;
-                height: 26px;
-            }}
-            QComboBox::drop-down {{
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border: none;
-                background: transparent;
-            }}
-            QComboBox::down-arrow {{
-                image: url("{arrow_path}");
-                width: 16px;
-                height: 16px;
-            }}
-            QComboBox::item:hover {{
-                background-color: #F0F0F0;  /* Hover color */
-            }}
-            QComboBox QAbstractItemView {{
-                border: 1px solid #aaaaaa;
-                border-radius: 6px;
-                selection-background-color: #d0f0c0;
-            }}
-            QComboBox QAbstractItemView::item:hover {{
-                background-color: #F0F0F0;      /* Hover color: very light gray */
-                border-radius: 6px;              /* Keep rounded corners */
-                color: black;                   /* Hover text color */
-            }}
-        """)
+        # Current model display name, kept in sync instead of queried per bubble
+        self._current_model_text = ""
+        self.AI_engine_box.currentTextChanged.connect(self._on_model_text_changed)
+
+        # Style comes from the panel stylesheet (_STYLESHEET)
+        self.AI_engine_box.setObjectName("AIEngineBox")
         #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         
         bot_layout.addWidget(self.AI_engine_box)
@@ -415,24 +558,12 @@ class Right_AIChat_Panel(QWidget):
 
         # Send Button
         self.btn_send = QPushButton("")
-        self.btn_send.setIcon(QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-enter-100.png")))
+        self.btn_send.setIcon(_cached_icon("icons8-enter-100.png"))
         self.btn_send.setIconSize(QSize(18, 18))
         self.btn_send.setFixedSize(36, 36)
         self.btn_send.setCursor(Qt.PointingHandCursor)
         self.btn_send.clicked.connect(self.on_send_clicked)
-        self.btn_send.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #aaaaaa;
-                border-radius: 18px; /* Circular */
-            }
-            QPushButton:hover { 
-                background-color: #F0F0F0;  /* Hover color */ 
-            }
-            QPushButton:pressed { 
-                background-color: #005a9e; 
-            }
-        """)
+        self.btn_send.setObjectName("ChatSendBtn")
         bot_layout.addWidget(self.btn_send)
 
         layout.addLayout(bot_layout)
@@ -445,16 +576,38 @@ class Right_AIChat_Panel(QWidget):
         Reload AI configuration and refresh the model combobox.
         Can be called dynamically when settings change.
         """
-        # Clear existing items
-        self.AI_engine_box.clear()
-        self.model_icons = [] # Initialize here to ensure it exists
-        
+        # Hidden or collapsed panel: defer the reload until it is shown again
+        # (the very first load always runs, the chat controller needs the model list)
+        if hasattr(self, 'models') and not self._is_panel_shown():
+            self._pending_model_refresh = True
+            return
+        self._pending_model_refresh = False
+
         # Get the AI engine list from usr/account.josn file
         usr_dir = utils.get_global_usr_dir()
         account_file = usr_dir / "Settings/account.json"
+
+        # account.json unchanged since the last refresh and the combobox is populated: nothing to do
+        mtime = account_file.stat().st_mtime_ns if account_file.exists() else None
+        if (mtime is not None and mtime == self._ai_config_cache["mtime"]
+                and self.AI_engine_model.rowCount() > 0):
+            self.AI_provider, self.base_url, self.api_key, self.models = self._ai_config_cache["value"]
+            return
+
+        # Silence the combobox while it is repopulated; one model_changed_signal is emitted at the end
+        self.AI_engine_box.blockSignals(True)
+        self.AI_engine_box.setUpdatesEnabled(False)
+
+        # Clear existing items
+        self.AI_engine_model.clear()
+        self.model_icons = [] # Initialize here to ensure it exists
         
         # Load config (now safe if file missing)
         self.AI_provider, self.base_url, self.api_key, self.models = self.load_AI_config(account_file)
+        self._ai_config_cache = {
+            "mtime": mtime,
+            "value": (self.AI_provider, self.base_url, self.api_key, self.models),
+        }
         
         if self.api_key and self.models:
             print("[INFO] API Key:", self.api_key)
@@ -464,10 +617,15 @@ class Right_AIChat_Panel(QWidget):
             # Use language manager if available, otherwise use English text
             placeholder = "No AI Models Configured"
             if hasattr(self, 'lang_manager') and self.lang_manager:
-                placeholder = self.lang_manager.get_text("No AI Models Configured")
-            self.AI_engine_box.addItem(placeholder)
+                placeholder = self._t("No AI Models Configured")
+            self.AI_engine_model.appendRow(QStandardItem(placeholder))
+            self.AI_engine_box.setUpdatesEnabled(True)
+            self.AI_engine_box.blockSignals(False)
+            self._on_model_text_changed(self.AI_engine_box.currentText())
             return
 
+        model_items = []
+
         for full_model_name in self.models:
             
             if "/" in full_model_name:
@@ -477,43 +635,170 @@ class Right_AIChat_Panel(QWidget):
                 # print(f"[WARNING] Your model format is 'model_name', such as those in DeepSeek or Qwen.")
                 AI_engine = full_model_name
 
+            # Rules are checked in order; the first rule that matches wins
             fname_lower = full_model_name.lower()
-            if any(k in fname_lower for k in ["openai", "gpt"]):
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-chatgpt-100-2.png"))
-            elif "openrouter" in fname_lower:
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-openrouter-100.png"))
-            elif "tngtech" in fname_lower:
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-tngtech-100.png"))
-            elif "deepseek" in fname_lower:
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-deepseek-100.png"))
-            elif "qwen" in fname_lower:
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-qwen-100.png"))
-            elif any(k in fname_lower for k in ["google", "gemma", "gemini"]):
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-Gemma-100.png"))
-            elif any(k in fname_lower for k in ["meta", "llama"]):
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-meta-100.png"))
-            elif "kwaipilot" in fname_lower:
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-meta-100.png"))
-            elif any(k in fname_lower for k in ["x-ai", "grok"]):
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-grok-100.png"))
-            elif any(k in fname_lower for k in ["mistral"]):
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-Mistral-100.svg"))
-            else:
-                icon = QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-Mistral-100.svg"))  # default blank icon
+            icon_name = next(
+                (icon_file for icon_file, pattern in self.ICON_RULES if pattern.search(fname_lower)),
+                self.DEFAULT_MODEL_ICON
+            )
+            icon = _cached_icon(icon_name)
 
-            # Add the model to the combobox
-            self.AI_engine_box.addItem(icon, AI_engine)
+            # Collect the row; all rows are inserted into the model at once below
+            item = QStandardItem(icon, AI_engine)
+            item.setData(full_model_name, Qt.UserRole)
+            model_items.append(item)
             self.model_icons.append(icon)
 
+        # Single rowsInserted notification for the whole list
+        self.AI_engine_model.invisibleRootItem().appendRows(model_items)
+
+        self.AI_engine_box.setUpdatesEnabled(True)
+        self.AI_engine_box.blockSignals(False)
+        self._on_model_text_changed(self.AI_engine_box.currentText())
+        self.emit_model_changed(self.AI_engine_box.currentIndex())
+
+
+
+
+
+
+
+
+
+
+
+    # ================= STYLESHEET =================
+    # One stylesheet for the whole panel, parsed once and matched by objectName
+    # (no per-widget setStyleSheet strings). The header, scroll area and chat container
+    # backgrounds also cover their descendants (scrollbar, bubbles), as the former
+    # per-widget sheets did; same-specificity rules later in the sheet win, so the
+    # container rule overrides the scroll area rule for the bubbles.
+    _ARROW_PATH = str(ICON_DIR / "icons8-expand-arrow-100.png").replace("\\", "/")
+    _STYLESHEET = f"""
+        QWidget#ChatHeader, QWidget#ChatHeader QWidget {{
+            background-color: #f8f9fa;
+        }}
+        QLabel#ChatTitle {{
+            font-weight: bold;
+            font-size: 15px;
+            color: #333;
+        }}
+        QWidget#ChatHeader QPushButton#ChatHeaderBtn {{
+            background-color: transparent;
+            border: none;
+        }}
+        QWidget#ChatHeader QPushButton#ChatHeaderBtn:hover {{
+            background-color: #F0F0F0;  /* Hover color */
+        }}
+        QWidget#ChatHeader QPushButton#ChatHeaderBtn:pressed {{
+            background-color: #005a9e;   /* Pressed color */
+        }}
+        QFrame#ChatDivider {{
+            background-color: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 rgba(0, 0, 0, 25),
+                stop:0.5 rgba(0, 0, 0, 45),
+                stop:1 rgba(0, 0, 0, 25)
+            );
+        }}
+        QScrollArea#ChatScrollArea, QScrollArea#ChatScrollArea QWidget {{
+            background: transparent;
+        }}
+        QWidget#ChatContainer, QWidget#ChatContainer QWidget {{
+            background-color: #f4f6f9;
+        }}
+        QWidget#ChatContainer QWidget#ChatBottomBuffer {{
+            background: transparent;
+        }}
+        QFrame#FloatingInput {{
+            background-color: #FFFFFF;
+            border-radius: 16px;
+            border: 1px solid #e0e0e0;
+        }}
+        QPushButton#ChatIconBtn {{
+            border: none;
+            border-radius: 4px;
+            background: transparent;
+        }}
+        QPushButton#ChatIconBtn:hover {{
+            background-color: #f0f0f0;
+        }}
+        QTextEdit#ChatInput {{
+            background: transparent;
+            font-size: 14px;
+            color: #333;
+            selection-background-color: #0078d4;
+        }}
+        QPushButton#ChatImageBtn {{
+            border: 1px solid #aaaaaa;
+            border-radius: 6px;
+            background: transparent;
+        }}
+        QPushButton#ChatImageBtn:hover {{
+            background-color: #f0f0f0;
+        }}
+        QComboBox#AIEngineBox {{
+            border: 1px solid #aaaaaa;
+            border-radius: 8px;
+            padding: 2px 0px 2px 0px;
+            min-width: 6em;
+            height: 26px;
+        }}
+        QComboBox#AIEngineBox::drop-down {{
+            subcontrol-origin: padding;
+            subcontrol-position: top right;
+            width: 20px;
+            border: none;
+            background: transparent;
+        }}
+        QComboBox#AIEngineBox::down-arrow {{
+            image: url("{_ARROW_PATH}");
+            width: 16px;
+            height: 16px;
+        }}
+        QComboBox#AIEngineBox::item:hover {{
+            background-color: #F0F0F0;  /* Hover color */
+        }}
+        QComboBox#AIEngineBox QAbstractItemView {{
+            border: 1px solid #aaaaaa;
+            border-radius: 6px;
+            selection-background-color: #d0f0c0;
+        }}
+        QComboBox#AIEngineBox QAbstractItemView::item:hover {{
+            background-color: #F0F0F0;      /* Hover color: very light gray */
+            border-radius: 6px;              /* Keep rounded corners */
+            color: black;                   /* Hover text color */
+        }}
+        QPushButton#ChatSendBtn {{
+            background-color: transparent;
+            border: 1px solid #aaaaaa;
+            border-radius: 18px; /* Circular */
+        }}
+        QPushButton#ChatSendBtn:hover {{
+            background-color: #F0F0F0;  /* Hover color */
+        }}
+        QPushButton#ChatSendBtn:pressed {{
+            background-color: #005a9e;
+        }}
+    """
 
-
-
-
-
-
-
-
-
+    # Placeholder shown when account.json has no models, in every UI language
+    NO_MODELS_TEXTS = frozenset({"No AI Models Configured", "未配置 AI 模型"})
+
+    # ================= MODEL ICON RULES =================
+    # (icon file, precompiled model-name pattern), in priority order
+    ICON_RULES = [
+        ("icons8-chatgpt-100-2.png",  re.compile(r"openai|gpt")),
+        ("icons8-openrouter-100.png", re.compile(r"openrouter")),
+        ("icons8-tngtech-100.png",    re.compile(r"tngtech")),
+        ("icons8-deepseek-100.png",   re.compile(r"deepseek")),
+        ("icons8-qwen-100.png",       re.compile(r"qwen")),
+        ("icons8-Gemma-100.png",      re.compile(r"google|gemma|gemini")),
+        ("icons8-meta-100.png",       re.compile(r"meta|llama|kwaipilot")),
+        ("icons8-grok-100.png",       re.compile(r"x-ai|grok")),
+        ("icons8-Mistral-100.svg",    re.compile(r"mistral")),
+    ]
+    DEFAULT_MODEL_ICON = "icons8-Mistral-100.svg"  # default blank icon
 
     # ================= LAYOUT CONSTANTS =================
     # Layout constants: Unify management of all margins and ratios for easy adjustment
@@ -541,7 +826,23 @@ class Right_AIChat_Panel(QWidget):
         """
         # Calculate ideal container height
         # Text box height is now limited to 30-120px by CSS, handles scrolling automatically
-        doc_height = self.chat_line_edit.document().size().height()
+        # QTextDocument.size() forces a layout pass; reuse it while text and width are unchanged
+        doc = self.chat_line_edit.document()
+        viewport_width = self.chat_line_edit.viewport().width()
+        doc_key = (doc.revision(), viewport_width)
+        if doc_key != self._last_doc_key:
+            self._last_doc_key = doc_key
+            # Measure a copy in the off-screen document (images need the rich-text copy for their height)
+            measure = self._measure_doc
+            measure.setDefaultFont(doc.defaultFont())
+            measure.setDocumentMargin(doc.documentMargin())
+            measure.setTextWidth(viewport_width)
+            if self.pending_images:
+                measure.setHtml(self.chat_line_edit.toHtml())
+            else:
+                measure.setPlainText(self.chat_line_edit.toPlainText())
+            self._last_doc_height = measure.size().height()
+        doc_height = self._last_doc_height
         text_height = min(max(doc_height, 30), 120)  # Limit to 30-120px
         
         # Container height = text height + top row(~38px) + bottom row(~42px) + padding(12px) + spacing(20px)
@@ -565,6 +866,10 @@ class Right_AIChat_Panel(QWidget):
         width_changed = (new_width != curr_width)
         height_changed = (new_height != curr_height)
         
+        # Nothing changed: skip the geometry update entirely
+        if not (width_changed or height_changed):
+            return
+
         # If width or height changed, update position
         if width_changed or height_changed:
             geo = self.input_container.geometry()
@@ -585,12 +890,18 @@ class Right_AIChat_Panel(QWidget):
             new_x = h_margin
             
             # Atomic update: set position and size together to prevent visual jitter
-            self.input_container.setGeometry(
-                new_x, 
-                new_y, 
-                new_width, 
-                new_height
-            )
+            # Painting is suspended so the shadowed container repaints once afterwards
+            self.input_container.setUpdatesEnabled(False)
+            try:
+                self.input_container.setGeometry(
+                    new_x, 
+                    new_y, 
+                    new_width, 
+                    new_height
+                )
+            finally:
+                self.input_container.setUpdatesEnabled(True)
+                self.input_container.update()
 
     def update_input_container_position(self):
         """
@@ -611,8 +922,6 @@ class Right_AIChat_Panel(QWidget):
         container_w = max(50, container_w)
         x = h_margin  # Left margin
         
-        self.input_container.setFixedWidth(container_w)
-        
         # Calculate vertical position
         # Always fixed at bottom
         margin_bottom = self.LAYOUT_CONSTANTS['bottom_margin']
@@ -626,9 +935,35 @@ class Right_AIChat_Panel(QWidget):
         #     margin_bottom = self.LAYOUT_CONSTANTS['bottom_margin']
         #     y = parent_h - container_h - margin_bottom
         
-        # Apply position and raise to top
-        self.input_container.move(x, y)
-        self.input_container.raise_()
+        # Geometry already in place: skip the writes and the repaint, only keep it on top
+        if (self.input_container.width() == container_w
+                and self.input_container.x() == x and self.input_container.y() == y):
+            self.input_container.raise_()
+            self.input_shadow.stackUnder(self.input_container)
+            return
+
+        # Apply width, position and raise to top with painting suspended (one repaint)
+        self.input_container.setUpdatesEnabled(False)
+        try:
+            self.input_container.setFixedWidth(container_w)
+            self.input_container.move(x, y)
+            self.input_container.raise_()
+            self.input_shadow.stackUnder(self.input_container)
+        finally:
+            self.input_container.setUpdatesEnabled(True)
+            self.input_container.update()
+    #-----------------------------------------------------------------------------
+
+    #-----------------------------------------------------------------------------
+    def connect_controller(self, controller_slot):
+        """
+        Connect the chat controller to send_message_signal.
+
+        The connection is queued, so on_send_clicked clears the input and returns
+        to the event loop before the controller starts its (heavier) send work.
+        External code should connect through this helper rather than directly.
+        """
+        self.send_message_signal.connect(controller_slot, Qt.QueuedConnection)
     #-----------------------------------------------------------------------------
 
     #-----------------------------------------------------------------------------
@@ -645,6 +980,10 @@ class Right_AIChat_Panel(QWidget):
         4. Clears the input and pending image list.
         """
 
+        # Fast path: empty document and no images, skip copying the text out
+        if self.chat_line_edit.document().isEmpty() and not self.pending_images:
+            return
+
         text = self.chat_line_edit.toPlainText().strip()
         if not text and not self.pending_images:
             return  # Do not send empty messages
@@ -653,7 +992,7 @@ class Right_AIChat_Panel(QWidget):
         images = self.pending_images.copy()
         
         # Emit the signal for the main chat handler (show user message by default)
-        self.send_message_signal.emit(text, images, True)
+        self.send_message_signal.emit(SendRequest(text, images, True))
 
         # Clear input box and temporary images after sending
         self.chat_line_edit.clear()
@@ -661,13 +1000,10 @@ class Right_AIChat_Panel(QWidget):
 
         # Update the position of the input container
         self.messages_count += 1
-        self.adjust_input_height()
-        self.update_input_container_position()
-        self.scroll_area.verticalScrollBar().setValue(self.scroll_area.verticalScrollBar().maximum())
-        self.messages_count += 1
-        self.adjust_input_height()
-        self.update_input_container_position()
-        self.scroll_area.verticalScrollBar().setValue(self.scroll_area.verticalScrollBar().maximum())
+        self.schedule_input_layout()
+
+        # Scroll once the new bubble has been laid out
+        self.request_scroll_to_bottom()
     #-----------------------------------------------------------------------------
 
     #-----------------------------------------------------------------------------
@@ -687,14 +1023,9 @@ class Right_AIChat_Panel(QWidget):
         if not self.is_visible:
             self.toggle_panel()
             
-        # Store skip_format_instruction flag for controller to use
-        # We need to pass this to the controller somehow
-        # Option 1: Add it to the signal (requires modifying signal definition)
-        # Option 2: Store it as an instance variable for the controller to read
-        self._skip_format_instruction = skip_format_instruction
-        
-        # Emit signal to controller with show_user_message parameter
-        self.send_message_signal.emit(text, [], show_user_message)
+        # Emit signal to controller; the payload carries every per-send option, so
+        # queued requests cannot observe each other's flags
+        self.send_message_signal.emit(SendRequest(text, [], show_user_message, skip_format_instruction))
         
         # Add user bubble locally (controller might do this too, but usually UI updates immediately)
         # Note: The controller (Operation_Chat_Controller) usually handles adding the bubble 
@@ -705,9 +1036,7 @@ class Right_AIChat_Panel(QWidget):
         # So we just need to emit the signal.
         
         # However, we might want to ensure the UI updates (scroll to bottom)
-        QTimer.singleShot(100, lambda: self.scroll_area.verticalScrollBar().setValue(
-            self.scroll_area.verticalScrollBar().maximum()
-        ))
+        self.request_scroll_to_bottom()
     #-----------------------------------------------------------------------------
 
 
@@ -717,11 +1046,50 @@ class Right_AIChat_Panel(QWidget):
         """
         Handle window resize event
         Ensure input container adjusts correctly when window resizes
+        
+        Resize events arrive for every pixel of a drag, so the layout work is
+        deferred to _do_layout_update through a restartable single-shot timer.
         """
+        super().resizeEvent(event)
+        if not self._is_panel_shown():
+            self._layout_stale = True
+            return
+        self._layout_timer.start()
+
+    def _is_panel_shown(self):
+        """True when the panel is on screen and not collapsed by toggle_panel"""
+        return self.isVisible() and self.is_visible
+
+    def schedule_input_layout(self):
+        """
+        Request adjust_input_height + update_input_container_position.
+        Repeated requests restart one single-shot timer, so N calls give one layout pass.
+        """
+        self._adjust_timer.start()
+
+    def request_scroll_to_bottom(self):
+        """Scroll the chat to the bottom after the next frame; repeated requests share one job"""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(16, self._scroll_to_bottom)
+
+    def _scroll_to_bottom(self):
+        self._scroll_pending = False
+        sb = self._vscroll
+        sb.setValue(sb.maximum())
+
+    def _do_adjust_input_layout(self):
+        self.adjust_input_height()
+        self.update_input_container_position()
+
+    def _do_layout_update(self):
+        """Apply the (coalesced) layout update for the floating input and history panel"""
+
+        # Full layout pass supersedes any pending input-only request
+        self._adjust_timer.stop()
 
         # Update the input container height first
-        if hasattr(self, 'adjust_input_height'):
-            self.adjust_input_height()
+        self.adjust_input_height()
 
         # Then update its width and its position
         self.update_input_container_position()
@@ -735,112 +1103,163 @@ class Right_AIChat_Panel(QWidget):
             if not self.history_panel.animation_in_progress:
                 self.history_panel.move(0, 50) # Fixed: y=50 (below header)
 
-        super().resizeEvent(event)
-        
-        # Use moderate delay (30ms) to coalesce continuous resize events
-        # Avoids jitter from frequent updates while maintaining responsiveness
-        # QTimer.singleShot(30, self.adjust_input_height)
-
     def showEvent(self, event):
         """Ensure correct layout when window is first shown"""
         super().showEvent(event)
-        # Update position first, then height, ensuring correct initial display
-        QTimer.singleShot(0, self.update_input_container_position)
-        QTimer.singleShot(10, self.adjust_input_height)
+        if self._pending_model_refresh:
+            self.refresh_ai_models()
+        # Lay out immediately so the first paint is correct (no pending timer needed)
+        if self._initial_layout_done and not self._layout_stale:
+            return
+        self._layout_timer.stop()
+        self._do_layout_update()
+        self._initial_layout_done = True
+        self._layout_stale = False
 
-    def eventFilter(self, obj, event):
-        """Handle Enter key in text input"""
-        if obj == self.chat_line_edit and event.type() == QEvent.KeyPress:
-            key_event = event
-            if key_event.key() in (Qt.Key_Enter, Qt.Key_Return):
-                if key_event.modifiers() & Qt.ShiftModifier:
-                    # Shift+Enter: insert newline
-                    self.chat_line_edit.insertPlainText("\n")
-                    return True
-                else:
-                    # Enter: send message
-                    current_time = QDateTime.currentMSecsSinceEpoch()
-                    if current_time - self._last_send_time >= self._send_debounce_ms:
-                        self.on_send_clicked()
-                        self._last_send_time = current_time
-                    return True
-        return super().eventFilter(obj, event)
+    def on_enter_pressed(self):
+        """Send on Enter in the text input (throttled against key repeat)"""
+        if not self._send_timer.isActive():
+            self.on_send_clicked()
+            self._send_timer.start()
 
 
 
     # ================= CHAT OPERATIONS =================
     # Insert image
     def insert_image(self):
-        """Handle image insertion"""
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, "Select Image", "", "Images (*.png *.jpg *.jpeg *.bmp *.gif)"
-        )
-        if file_name:
-            self.pending_images.append(file_name)
-            
-            # Show thumbnail in text input
-            cursor = self.chat_line_edit.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            
-            img_format = QTextImageFormat()
-            img_format.setName(file_name)
-            img_format.setWidth(60) # Thumbnail size
-            img_format.setHeight(60)
-            cursor.insertImage(img_format)
-            cursor.insertText(" ")
-            
-            # Re-adjust height because image makes it taller
-            self.adjust_input_height()
+        """Handle image insertion (non-blocking dialog, no nested event loop)"""
+        dialog = QFileDialog(self, "Select Image", "", "Images (*.png *.jpg *.jpeg *.bmp *.gif)")
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_image_selected)
+        dialog.open()
+
+    def _on_image_selected(self, file_name):
+        """Attach the chosen image and show its thumbnail in the input box"""
+        if not file_name:
+            return
+
+        # Only the path is kept; listeners (the chat controller) can read/encode it ahead of sending
+        self.pending_images.append(file_name)
+        self.image_attached.emit(file_name)
+
+        # Register a thumbnail pre-scaled to its on-screen size under the image name, so the
+        # input document neither loads the full-resolution file nor rescales it on every paint
+        thumb_box = QSize(60, 60)  # Thumbnail size
+        thumb_size = thumb_box
+        dpr = self.chat_line_edit.devicePixelRatioF()
+        thumb = load_scaled_image(file_name, QSize(round(60 * dpr), round(60 * dpr)))
+        if not thumb.isNull():
+            thumb_pixmap = QPixmap.fromImage(thumb)
+            thumb_pixmap.setDevicePixelRatio(dpr)
+            self.chat_line_edit.document().addResource(
+                QTextDocument.ImageResource, QUrl(file_name), thumb_pixmap
+            )
+            # Keep the aspect ratio inside the 60 px box
+            thumb_size = thumb.size().scaled(thumb_box, Qt.KeepAspectRatio)
+        
+        # Show thumbnail in text input
+        # Group image + spacer into one edit block: one undo step and one relayout
+        cursor = self.chat_line_edit.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        
+        img_format = QTextImageFormat()
+        img_format.setName(file_name)
+        img_format.setWidth(thumb_size.width())
+        img_format.setHeight(thumb_size.height())
+        cursor.insertImage(img_format)
+        cursor.insertText(" ")
+        cursor.endEditBlock()
+        
+        # Re-adjust height because image makes it taller
+        self.schedule_input_layout()
 
     def add_message_bubble(self, text, is_user=True):
         """Add a message bubble using BubbleMessage class"""
-        # Ensure imports work, otherwise use fallback
+        self.insert_message_widgets([self._create_message_bubble(text, is_user)])
+
+    def add_messages(self, messages):
+        """Append several (text, is_user) messages with one relayout and one scroll"""
+        self.insert_message_widgets([self._create_message_bubble(text, is_user) for text, is_user in messages])
+
+    def _create_message_bubble(self, text, is_user):
+        # BubbleMessage is a hard module-level import, so no per-message fallback is needed
+        return BubbleMessage(
+            text=text,
+            is_user=is_user,
+            user_name="User",
+            model_name=self._current_model_text,
+            parent_width=self.chat_container.width()
+        )
+
+    def insert_message_widgets(self, widgets):
+        """
+        Insert message widgets (bubbles) before the bottom_buffer.
+        Painting is suspended for the whole batch and the layout is re-flowed once,
+        so reloading a long chat does not relayout per message.
+        """
+        self.chat_container.setUpdatesEnabled(False)
         try:
-            bubble = BubbleMessage(
-                text=text,
-                is_user=is_user,
-                user_name="User",
-                model_name=self.model_combo.currentText(),
-                parent_width=self.chat_container.width()
-            )
-        except Exception:
-            # Fallback if BubbleMessage is not fully compatible or imported
-            bubble = QLabel(f"{'User' if is_user else 'AI'}: {text}")
-            bubble.setWordWrap(True)
-            bubble.setStyleSheet(f"background: {'#d1e7dd' if is_user else '#fff'}; padding: 10px; border-radius: 10px;")
+            # Insert before the bottom_buffer (always last); its index is looked up once per batch
+            index = self.result_layout.count() - 1
+            for widget in widgets:
+                self.result_layout.insertWidget(index, widget)
+                index += 1
+        finally:
+            self.result_layout.invalidate()
+            self.chat_container.setUpdatesEnabled(True)
 
-        # Insert before the bottom_buffer
-        # layout.count() - 1 is the index of bottom_buffer
-        self.result_layout.insertWidget(self.result_layout.count() - 1, bubble)
-        
         # Scroll to bottom
-        QTimer.singleShot(100, lambda: self.scroll_area.verticalScrollBar().setValue(
-            self.scroll_area.verticalScrollBar().maximum()
-        ))
+        self.request_scroll_to_bottom()
 
 
     def clear_all_messages(self):
         """Reset chat to initial state"""
         # Remove all widgets except bottom_buffer (which is last)
-        # We iterate backwards from count-2 down to 0
-        while self.result_layout.count() > 1:
-            item = self.result_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # We iterate backwards from count-2 down to 0 (takeAt at the tail, no item shifting)
+        # with painting suspended, and re-flow the layout once at the end
+        self.chat_container.setUpdatesEnabled(False)
+        try:
+            for index in range(self.result_layout.count() - 2, -1, -1):
+                item = self.result_layout.takeAt(index)
+                widget = item.widget()
+                if widget:
+                    widget.setParent(None)  # Detach now so the layout stops tracking it
+                    widget.deleteLater()
+        finally:
+            self.result_layout.invalidate()
+            self.chat_container.setUpdatesEnabled(True)
         
         # Reset position to center
         self.messages_count = 0
-        self.update_input_container_position()
+        self.schedule_input_layout()
+
+    def _build_toggle_animation(self):
+        """Create the min/max width animations used by toggle_panel (once per panel)"""
+        # Create parallel animation group
+        self.anim_group = QParallelAnimationGroup(self)
+
+        # Animation for maximumWidth
+        self._anim_max = QPropertyAnimation(self, b"maximumWidth", self)
+        self._anim_max.setDuration(250)
+
+        # Animation for minimumWidth
+        self._anim_min = QPropertyAnimation(self, b"minimumWidth", self)
+        self._anim_min.setDuration(250)
+
+        self.anim_group.addAnimation(self._anim_max)
+        self.anim_group.addAnimation(self._anim_min)
 
     def toggle_panel(self):
         """Toggle panel visibility with parallel animation for min/max width"""
-        # Import animation classes locally to ensure availability
-        from PySide6.QtCore import QParallelAnimationGroup, QPropertyAnimation
-        
+        # A toggle during a running animation retargets it (start() is a no-op while running)
+        self.anim_group.stop()
+
         if self.is_visible:
             # Collapse
-            self.full_width = self.width()
             start_width = self.width()
+            self.full_width = start_width
             target_width = 0
         else:
             # Expand
@@ -850,30 +1269,34 @@ class Right_AIChat_Panel(QWidget):
             start_width = 0
             target_width = self.full_width
         
-        # Create parallel animation group
-        self.anim_group = QParallelAnimationGroup(self)
-        
-        # Animation for maximumWidth
-        anim_max = QPropertyAnimation(self, b"maximumWidth")
-        anim_max.setDuration(250)
-        anim_max.setStartValue(start_width if not self.is_visible else self.full_width)
-        anim_max.setEndValue(target_width)
-        
-        # Animation for minimumWidth
-        anim_min = QPropertyAnimation(self, b"minimumWidth")
-        anim_min.setDuration(250)
-        anim_min.setStartValue(start_width if not self.is_visible else self.full_width)
-        anim_min.setEndValue(target_width)
-        
-        self.anim_group.addAnimation(anim_max)
-        self.anim_group.addAnimation(anim_min)
+        # Retarget the reusable animations (collapse starts from the current width == full_width)
+        self._anim_max.setStartValue(start_width)
+        self._anim_max.setEndValue(target_width)
+        self._anim_min.setStartValue(start_width)
+        self._anim_min.setEndValue(target_width)
         
         # Update state
         self.is_visible = not self.is_visible
+
+        # Apply a model refresh deferred while collapsed
+        if self.is_visible and self._pending_model_refresh:
+            self.refresh_ai_models()
         
         # Start animation
         self.anim_group.start()
 
+    def _t(self, key):
+        """Translate key via lang_manager, memoized until the manager or its language changes"""
+        lang_manager = self.lang_manager
+        cache_key = (id(lang_manager), lang_manager.get_current_language())
+        if cache_key != self._i18n_key:
+            self._i18n_key = cache_key
+            self._i18n_cache = {}
+        text = self._i18n_cache.get(key)
+        if text is None:
+            text = self._i18n_cache[key] = lang_manager.get_text(key)
+        return text
+
     def update_ui_texts(self, lang_manager):
 
         """Update UI texts based on current language."""
@@ -885,38 +1308,25 @@ class Right_AIChat_Panel(QWidget):
         self.lang_manager = lang_manager
         
         # Update title
-        title_labels = self.findChildren(QLabel)
-        if title_labels:
-            title_labels[0].setText(lang_manager.get_text("AI Assistant"))
+        self.title_label.setText(self._t("AI Assistant"))
         
         # Update input placeholder
         if hasattr(self, 'input_text'):
-            self.input_text.setPlaceholderText(lang_manager.get_text("Ask AI assistant"))
+            self.input_text.setPlaceholderText(self._t("Ask AI assistant"))
         
         # # Update send button
         # if hasattr(self, 'btn_send'):
         #     self.btn_send.setText(lang_manager.get_text("Send"))
         
-        # Update new chat button tooltip
-        new_chat_buttons = self.findChildren(QPushButton)
-        for btn in new_chat_buttons:
-            if btn.toolTip() in ["New chat", "新建对话"]:
-                btn.setToolTip(lang_manager.get_text("New chat"))
-
-            if btn.toolTip() in ["Chat history", "聊天记录"]:
-                btn.setToolTip(lang_manager.get_text("Chat history"))
-
-            if btn.toolTip() in ["New folder", "新建文件夹"]:
-                btn.setToolTip(lang_manager.get_text("New folder"))
-
-            if btn.toolTip() in ["Show/Hide Chat History", "显示/隐藏聊天记录"]:
-                btn.setToolTip(lang_manager.get_text("Show/Hide Chat History"))
+        # Update button tooltips (no child-tree walk, no tooltip string matching)
+        for btn, key in self._tooltip_keys.items():
+            btn.setToolTip(self._t(key))
         
         # Update AI model combobox placeholder if it contains "No AI Models Configured"
         if hasattr(self, 'AI_engine_box'):
             current_text = self.AI_engine_box.currentText()
-            if current_text in ["No AI Models Configured", "未配置 AI 模型"]:
-                self.AI_engine_box.setItemText(0, lang_manager.get_text("No AI Models Configured"))
+            if current_text in self.NO_MODELS_TEXTS:
+                self.AI_engine_box.setItemText(0, self._t("No AI Models Configured"))
 
     # ------------------------------------------------------------------
 
@@ -952,6 +1362,9 @@ class Right_AIChat_Panel(QWidget):
         return QIcon()
 
 
+    def _on_model_text_changed(self, text):
+        self._current_model_text = text
+
     def emit_model_changed(self, new_model_index):
         if new_model_index < 0:
             return
@@ -982,20 +1395,14 @@ class Right_AIChat_Panel(QWidget):
         Returns:
             tuple: (provider, base_url, api_key, models)
         """
-        import json
-        from pathlib import Path
-
-        # Check if file exists
-        if not Path(config_path).exists():
-            print(f"[INFO] AI config file not found: {config_path}")
-            return None, None, None, []
-
         # -------------------------------
-        # Load JSON file
+        # Load JSON file (bytes in one read; a missing file is not an error)
         # -------------------------------
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = _json_loads(Path(config_path).read_bytes())
+        except FileNotFoundError:
+            print(f"[INFO] AI config file not found: {config_path}")
+            return None, None, None, []
         except Exception as e:
             print(f"[ERROR] Failed to load account file: {e}")
             return None, None, None, []
@@ -1008,10 +1415,12 @@ class Right_AIChat_Panel(QWidget):
         api_key = config.get("API-Key")
         models = config.get("models")
 
-        if not isinstance(models, (list, set)):
+        if isinstance(models, set):
+            models = list(models)
+        elif not isinstance(models, list):
             models = []
 
-        return AI_provider, base_url, api_key, list(models)
+        return AI_provider, base_url, api_key, models
     # ------------------------------------------------------------------
 
 
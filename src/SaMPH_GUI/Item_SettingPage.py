@@ -8,19 +8,20 @@
 import sys
 import os
 import json
-import requests
+from functools import lru_cache
 from pathlib import Path
 
 #-----------------------------------------------------------------------------------------
 # Import PySide6 widgets for creating the UI components
 from PySide6.QtWidgets import ( 
-    QFileDialog, QDialog, QHBoxLayout, QVBoxLayout, QTreeWidget, QTreeWidgetItem,
+    QFileDialog, QDialog, QHBoxLayout, QVBoxLayout, QListWidget, QListWidgetItem,
     QStackedWidget, QDialogButtonBox, QLineEdit, QLabel, QComboBox, QCheckBox, 
     QMessageBox, QPushButton, QWidget, QGroupBox, QFormLayout, QSlider, QTextEdit,
     QRadioButton, QButtonGroup, QScrollArea, QSpinBox
 )
-from PySide6.QtCore import Qt, Signal, QSettings
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QSettings, QUrl, QTimer
+from PySide6.QtGui import QFont, QFontDatabase, QStandardItemModel, QStandardItem
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 #-----------------------------------------------------------------------------------------
 
 #-----------------------------------------------------------------------------------------
@@ -37,6 +38,183 @@ except ImportError:
         def get_stylesheet(): return ""
 #-----------------------------------------------------------------------------------------
 
+#-----------------------------------------------------------------------------------------
+# Optional faster JSON (de)serializer; both helpers work on bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_indented(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+#-----------------------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------------------
+# Static combo contents and lookup tables, built once at import
+_PROVIDERS = (
+    "OpenRouter (Recommended)", 
+    "OpenAI (Official)",
+    "Alibaba Qwen (DashScope)", 
+    "DeepSeek (Official)", 
+    "X.AI (Grok)", 
+    "Groq (Meta Llama/Mixtral)",
+    "Google Gemini (via OpenRouter)",
+    "SiliconFlow (硅基流动)", 
+    "Ollama (Localhost)",
+    "Arli", 
+    "Custom" 
+)
+
+# Map providers to their OpenAI-Compatible Endpoint URLs
+_PROVIDER_URL_MAP = {
+    "OpenRouter (Recommended)": "https://openrouter.ai/api/v1/chat/completions",
+    "OpenAI (Official)": "https://api.openai.com/v1/chat/completions",
+    "Alibaba Qwen (DashScope)": "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
+    "DeepSeek (Official)": "https://api.deepseek.com/chat/completions",
+    "X.AI (Grok)": "https://api.x.ai/v1/chat/completions",
+    "Groq (Meta Llama/Mixtral)": "https://api.groq.com/openai/v1/chat/completions",
+    "Google Gemini (via OpenRouter)": "https://openrouter.ai/api/v1/chat/completions",
+    "SiliconFlow (硅基流动)": "https://api.siliconflow.cn/v1/chat/completions",
+    "Ollama (Localhost)": "http://localhost:11434/v1/chat/completions",
+    "Arli": "https://api.arliai.com/v1/chat/completions"
+}
+
+# Map internal provider names (account.json) to display names
+_PROVIDER_DISPLAY_MAP = {
+    "openrouter": "OpenRouter (Recommended)",
+    "openai": "OpenAI (Official)",
+    "qwen": "Alibaba Qwen (DashScope)",
+    "deepseek": "DeepSeek (Official)",
+    "xai": "X.AI (Grok)",
+    "x.ai": "X.AI (Grok)",
+    "groq": "Groq (Meta Llama/Mixtral)",
+    "gemini": "Google Gemini (via OpenRouter)",
+    "siliconflow": "SiliconFlow (硅基流动)",
+    "ollama": "Ollama (Localhost)",
+    "arli": "Arli"
+}
+
+_FONT_NAMES = (
+    "Arial", "Calibri", "Times New Roman", "Courier New", 
+    "Microsoft YaHei", "SimHei", "SimSun", 
+    "KaiTi", "FangSong", 
+    "STHeiti", "STKaiti", "STSong", "STFangsong", "PingFang SC"
+)
+
+
+@lru_cache(maxsize=1)
+def _available_fonts():
+    """Candidate fonts installed on this system (needs a running QGuiApplication)."""
+    installed = set(QFontDatabase.families())
+    return tuple(f for f in _FONT_NAMES if f in installed) or _FONT_NAMES
+
+
+_FONT_SIZES = tuple(str(s) for s in range(8, 30))
+
+# Temperature slider labels, indexed by slider value (0..20 -> "0.0".."2.0")
+_TEMP_LABELS = tuple(str(i / 10.0) for i in range(21))
+
+_CURVE_WIDTHS = ("1.0", "1.5", "2.0", "2.5", "3.0", "3.5", "4.0", "4.5", "5.0")
+_CURVE_WIDTH_SET = frozenset(_CURVE_WIDTHS)
+
+_CURVE_COLOR_PRESETS = (
+    ("Dark Blue", "#1F4788"),
+    ("Navy Blue", "#000080"),
+    ("Red", "#FF0000"),
+    ("Green", "#00AA00"),
+    ("Black", "#000000"),
+    ("Purple", "#800080"),
+    ("Orange", "#FF8C00"),
+    ("Cyan", "#00FFFF"),
+    ("Dark Gray", "#404040"),
+    ("Brown", "#8B4513"),
+)
+
+_BG_COLOR_PRESETS = (
+    ("White", "#FFFFFF"),
+    ("Light Gray", "#FAFAFA"),
+    ("Light Blue", "#F0F8FF"),
+    ("Light Green", "#F0FFF0"),
+    ("Cream", "#FFFDD0"),
+    ("Snow", "#FFFAFA"),
+    ("Ghost White", "#F8F8FF"),
+    ("Light Yellow", "#FFFFE0"),
+    ("Off White", "#FAF0E6"),
+    ("Honeydew", "#F0FFF0"),
+)
+
+# Hex -> combo index; the first preset wins when two share a hex value
+def _index_by_hex(presets):
+    index = {}
+    for i, (_, hex_val) in enumerate(presets):
+        index.setdefault(hex_val, i)
+    return index
+
+_CURVE_COLOR_INDEX = _index_by_hex(_CURVE_COLOR_PRESETS)
+_BG_COLOR_INDEX = _index_by_hex(_BG_COLOR_PRESETS)
+
+# Result chart controls written by export_chart_settings, in file order
+_CHART_EXPORT_FIELDS = (
+    ("curve_style", "currentText"),
+    ("curve_color", "currentData"),
+    ("curve_width", "currentText"),
+    ("scatter_style", "currentText"),
+    ("axis_style", "currentText"),
+    ("grid_style", "currentText"),
+    ("bg_color", "currentData"),
+)
+
+# Result chart combos restored by text in import_chart_settings
+_CHART_TEXT_FIELDS = ("curve_style", "curve_width", "scatter_style", "axis_style", "grid_style")
+
+# Preset backgrounds that need dark text in the color combo
+_LIGHT_COLORS = frozenset({'#FFFFFF', '#FFFDD0', '#FFFAFA', '#F8F8FF', '#FFFFE0', '#FAF0E6', '#F0FFF0'})
+
+# Color combo preview; filled with the preset as background and a readable text color
+_COLOR_COMBO_STYLE = """
+    QComboBox {{
+        background-color: {bg};
+        color: {fg};
+        padding: 2px;
+        border-radius: 3px;
+    }}
+"""
+
+# Navigation list style, scoped by object name so it can live in the dialog stylesheet
+_TREE_STYLE = """
+    QListWidget#preference_tree {
+        border: 1px solid #D3D3D3;
+        border-radius: 8px;
+        padding: 0px;
+        background-color: #fafafa;
+    }
+    QListWidget#preference_tree::item { 
+        padding: 10px; 
+        color: #333333;
+        border-radius: 4px;
+        margin: 2px 4px;
+    }
+    QListWidget#preference_tree::item:hover { 
+        background-color: #E8E8E8; 
+    }
+    QListWidget#preference_tree::item:selected { 
+        background-color: #DCDCDC; 
+        color: #333333;
+        font-weight: bold;
+    }
+"""
+
+
+@lru_cache(maxsize=1)
+def _dialog_stylesheet(theme_qss):
+    """Theme QSS plus the dialog's own rules, concatenated once per theme string."""
+    return theme_qss + "\n" + _TREE_STYLE
+#-----------------------------------------------------------------------------------------
+
 #-----------------------------------------------------------------------------------------
 # Define the Setting_Window class for the Preferences Dialog
 class Setting_Window(QDialog):
@@ -53,6 +231,12 @@ class Setting_Window(QDialog):
     font_changed = Signal(str, int)
     ai_settings_changed = Signal()
 
+    # Parsed account.json keyed by path -> (st_mtime_ns, data), shared by all dialogs
+    _account_cache = {}
+
+    # The usr folder only needs creating once per process
+    _usr_dir_verified = False
+
 
     #-------------------------------------------------------------------------------------
     def __init__(self, parent=None):
@@ -65,63 +249,47 @@ class Setting_Window(QDialog):
         #---------------------------------------------------------------------------------
         # Setup Settings File
         usr_folder = utils.get_global_usr_dir()
-        os.makedirs(usr_folder, exist_ok = True)
+        if not Setting_Window._usr_dir_verified:
+            os.makedirs(usr_folder, exist_ok = True)
+            Setting_Window._usr_dir_verified = True
         setting_file_path = usr_folder / "Settings/settings.ini"
         self.settings = QSettings(str(setting_file_path), QSettings.Format.IniFormat)
+        self.settings.setFallbacksEnabled(False)
+
+        # Snapshot the .ini once; the page creators read from this dict
+        self._reload_settings_cache()
         #---------------------------------------------------------------------------------
 
         #---------------------------------------------------------------------------------
         # Main Layout
         main_layout = QHBoxLayout()
 
-        # Left: Navigation Tree
-        self.preference_tree = QTreeWidget()
-        self.preference_tree.setHeaderHidden(True)
+        # Left: Navigation list (flat, one row per page)
+        self.preference_tree = QListWidget()
+        self.preference_tree.setObjectName("preference_tree")  # style rules match before items exist
         self.preference_tree.setFixedWidth(180)
         main_layout.addWidget(self.preference_tree)
 
         #---------------------------------------------------------------------------------
-        # Define navigation tree items
-        self.item_ai = QTreeWidgetItem(["AI Configuration"]) 
-        self.item_appearance = QTreeWidgetItem(["Appearance"])
-        self.item_font = QTreeWidgetItem(["Font Settings"])
-        self.item_language = QTreeWidgetItem(["Language Settings"])
-        self.item_search = QTreeWidgetItem(["Search"])
-        self.item_result_chart = QTreeWidgetItem(["Result Chart"])
+        # Define navigation items; row order matches the page order in the stack
+        self.item_ai = QListWidgetItem("AI Configuration")
+        self.item_appearance = QListWidgetItem("Appearance")
+        self.item_font = QListWidgetItem("Font Settings")
+        self.item_language = QListWidgetItem("Language Settings")
+        self.item_search = QListWidgetItem("Search")
+        self.item_result_chart = QListWidgetItem("Result Chart")
         
-        self.preference_tree.addTopLevelItems([
+        self.preference_tree.setUpdatesEnabled(False)
+        for item in (
             self.item_ai, 
             self.item_appearance, 
             self.item_font, 
             self.item_language, 
             self.item_search,
             self.item_result_chart
-        ])
-        self.preference_tree.setIndentation(0)
-
-        # Style the navigation tree
-        self.preference_tree.setStyleSheet("""
-            QTreeWidget {
-                border: 1px solid #D3D3D3;
-                border-radius: 8px;
-                padding: 0px;
-                background-color: #fafafa;
-            }
-            QTreeWidget::item { 
-                padding: 10px; 
-                color: #333333;
-                border-radius: 4px;
-                margin: 2px 4px;
-            }
-            QTreeWidget::item:hover { 
-                background-color: #E8E8E8; 
-            }
-            QTreeWidget::item:selected { 
-                background-color: #DCDCDC; 
-                color: #333333;
-                font-weight: bold;
-            }
-        """)
+        ):
+            self.preference_tree.addItem(item)
+        self.preference_tree.setUpdatesEnabled(True)
 
         # Right: Pages in scroll area
         scroll = QScrollArea()
@@ -137,25 +305,27 @@ class Setting_Window(QDialog):
         }
 
         #---------------------------------------------------------------------------------
-        # Create pages
-        self.ai_page = self.create_ai_page_in_setting()
-        self.appearance_page = self.create_appearance_page_in_setting()
-        self.font_page = self.create_font_page_in_setting()
-        self.language_page = self.create_language_page_in_setting()
-        self.search_page = self.create_search_page_in_setting()
-        self.result_chart_page = self.create_result_chart_page_in_setting()
-
-        self.stack.addWidget(self.ai_page)
-        self.stack.addWidget(self.appearance_page)
-        self.stack.addWidget(self.font_page)
-        self.stack.addWidget(self.language_page)
-        self.stack.addWidget(self.search_page)
-        self.stack.addWidget(self.result_chart_page)
+        # Create pages on first navigation; only the default AI page is built up front
+        self._page_builders = (
+            self.create_ai_page_in_setting,
+            self.create_appearance_page_in_setting,
+            self.create_font_page_in_setting,
+            self.create_language_page_in_setting,
+            self.create_search_page_in_setting,
+            self.create_result_chart_page_in_setting,
+        )
+        self._built_pages = {}
+        self._nam = None
+
+        # Empty placeholders keep list row == stack index until a page is built
+        for _ in self._page_builders:
+            self.stack.addWidget(QWidget())
+        self.ensure_page(0)
 
         #---------------------------------------------------------------------------------
         # Connect navigation
-        self.preference_tree.currentItemChanged.connect(self.change_page)
-        self.preference_tree.setCurrentItem(self.item_ai)
+        self.preference_tree.currentRowChanged.connect(self.change_page)
+        self.preference_tree.setCurrentRow(0)
 
         #---------------------------------------------------------------------------------
         # Add dialog buttons with Apply
@@ -170,14 +340,23 @@ class Setting_Window(QDialog):
         layout.addLayout(main_layout)
         layout.addWidget(self.button_box)
 
-        # Apply theme styling
-        self.setStyleSheet(Theme_SaMPH.get_stylesheet())
+        # Flush pending writes to disk once, when the dialog closes
+        self.finished.connect(self.settings.sync)
+
+        # Apply theme styling (one stylesheet, one polish pass)
+        self.set_theme_stylesheet(Theme_SaMPH.get_stylesheet())
     #-------------------------------------------------------------------------------------
 
 
 
 
 
+    #-------------------------------------------------------------------------------------
+    # Apply the theme together with the dialog's own rules in a single setStyleSheet
+    def set_theme_stylesheet(self, theme_qss):
+        self.setStyleSheet(_dialog_stylesheet(theme_qss))
+    #-------------------------------------------------------------------------------------
+
     #-------------------------------------------------------------------------------------
     # Create the AI Settings Page
     def create_ai_page_in_setting(self):
@@ -195,21 +374,9 @@ class Setting_Window(QDialog):
         # 1. Provider
         self.lbl_provider = QLabel("Provider:")
         self.provider_combo = QComboBox()
-        self.provider_combo.addItems([
-            "OpenRouter (Recommended)", 
-            "OpenAI (Official)",
-            "Alibaba Qwen (DashScope)", 
-            "DeepSeek (Official)", 
-            "X.AI (Grok)", 
-            "Groq (Meta Llama/Mixtral)",
-            "Google Gemini (via OpenRouter)",
-            "SiliconFlow (硅基流动)", 
-            "Ollama (Localhost)",
-            "Arli", 
-            "Custom" 
-        ])
+        self.provider_combo.addItems(list(_PROVIDERS))
         
-        saved_provider = self.settings.value("AI/provider", "OpenRouter (Recommended)")
+        saved_provider = self._sval("AI/provider", "OpenRouter (Recommended)")
         self.provider_combo.setCurrentText(saved_provider)
         self.provider_combo.currentTextChanged.connect(self.on_provider_changed)
         self.controls["AI"]["provider"] = self.provider_combo
@@ -227,7 +394,7 @@ class Setting_Window(QDialog):
             # Fallback if file doesn't exist or is empty
             model_input.addItem("No models configured")
         
-        saved_model = self.settings.value("AI/model", "")
+        saved_model = self._sval("AI/model", "")
         if saved_model and saved_model in available_models:
             model_input.setCurrentText(saved_model)
         elif available_models:
@@ -240,7 +407,7 @@ class Setting_Window(QDialog):
         base_url_input = QLineEdit()
         base_url_input.setPlaceholderText("https://...")
         default_url = "https://openrouter.ai/api/v1/chat/completions"
-        base_url_input.setText(self.settings.value("AI/base_url", default_url))
+        base_url_input.setText(self._sval("AI/base_url", default_url))
         self.controls["AI"]["base_url"] = base_url_input
 
         # 4. API Key
@@ -248,7 +415,7 @@ class Setting_Window(QDialog):
         api_input = QLineEdit()
         api_input.setEchoMode(QLineEdit.EchoMode.Password)
         api_input.setPlaceholderText("sk-...")
-        api_input.setText(self.settings.value("AI/api_key", ""))
+        api_input.setText(self._sval("AI/api_key", ""))
         self.controls["AI"]["api_key"] = api_input
 
         # 5. Test Connection Button
@@ -273,7 +440,7 @@ class Setting_Window(QDialog):
         sys_prompt = QTextEdit()
         sys_prompt.setPlaceholderText("You are a helpful assistant...")
         sys_prompt.setMaximumHeight(80)
-        sys_prompt.setPlainText(self.settings.value("AI/system_prompt", "You are a helpful assistant."))
+        sys_prompt.setPlainText(self._sval("AI/system_prompt", "You are a helpful assistant."))
         self.controls["AI"]["system_prompt"] = sys_prompt
 
         # 7. Temperature
@@ -282,18 +449,24 @@ class Setting_Window(QDialog):
         temp_h = QHBoxLayout(temp_container)
         temp_h.setContentsMargins(0,0,0,0)
         
-        temp_slider = QSlider(Qt.Orientation.Horizontal)
-        temp_slider.setRange(0, 20) 
-        saved_temp = int(float(self.settings.value("AI/temperature", 0.7)) * 10)
-        temp_slider.setValue(saved_temp)
+        self.temp_slider = QSlider(Qt.Orientation.Horizontal)
+        self.temp_slider.setRange(0, 20) 
+        saved_temp = round(self._sval("AI/temperature", 0.7, type=float) * 10)
+        self.temp_slider.setValue(saved_temp)
         
-        temp_label = QLabel(str(saved_temp / 10.0))
-        temp_label.setFixedWidth(35)
-        temp_slider.valueChanged.connect(lambda v: temp_label.setText(str(v/10.0)))
+        self.temp_label = QLabel(_TEMP_LABELS[self.temp_slider.value()])
+        self.temp_label.setFixedWidth(35)
+
+        # Refresh the label at most once per frame while the slider is dragged
+        self._temp_label_timer = QTimer(self)
+        self._temp_label_timer.setSingleShot(True)
+        self._temp_label_timer.setInterval(16)
+        self._temp_label_timer.timeout.connect(self._update_temp_label)
+        self.temp_slider.valueChanged.connect(lambda _: self._temp_label_timer.start())
         
-        temp_h.addWidget(temp_slider)
-        temp_h.addWidget(temp_label)
-        self.controls["AI"]["temperature"] = temp_slider
+        temp_h.addWidget(self.temp_slider)
+        temp_h.addWidget(self.temp_label)
+        self.controls["AI"]["temperature"] = self.temp_slider
 
         behavior_layout.addRow(self.lbl_sys_prompt, sys_prompt)
         behavior_layout.addRow(self.lbl_temperature, temp_container)
@@ -308,26 +481,18 @@ class Setting_Window(QDialog):
         layout.addStretch()
         return page
 
+    def _update_temp_label(self):
+        self.temp_label.setText(_TEMP_LABELS[self.temp_slider.value()])
+
     def on_provider_changed(self, provider_name):
         """Map providers to their OpenAI-Compatible Endpoint URLs."""
         # Safety check: base_url control might not exist yet during initialization
         if not hasattr(self, 'controls') or "AI" not in self.controls or "base_url" not in self.controls["AI"]:
             return
             
-        url_map = {
-            "OpenRouter (Recommended)": "https://openrouter.ai/api/v1/chat/completions",
-            "OpenAI (Official)": "https://api.openai.com/v1/chat/completions",
-            "Alibaba Qwen (DashScope)": "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-            "DeepSeek (Official)": "https://api.deepseek.com/chat/completions",
-            "X.AI (Grok)": "https://api.x.ai/v1/chat/completions",
-            "Groq (Meta Llama/Mixtral)": "https://api.groq.com/openai/v1/chat/completions",
-            "Google Gemini (via OpenRouter)": "https://openrouter.ai/api/v1/chat/completions",
-            "SiliconFlow (硅基流动)": "https://api.siliconflow.cn/v1/chat/completions",
-            "Ollama (Localhost)": "http://localhost:11434/v1/chat/completions",
-            "Arli": "https://api.arliai.com/v1/chat/completions"
-        }
-        if provider_name in url_map:
-            self.controls["AI"]["base_url"].setText(url_map[provider_name])
+        url = _PROVIDER_URL_MAP.get(provider_name)
+        if url:
+            self.controls["AI"]["base_url"].setText(url)
 
     def load_available_models(self):
         """
@@ -338,47 +503,50 @@ class Setting_Window(QDialog):
             usr_folder = utils.get_global_usr_dir()
             account_file = usr_folder / "Settings/account.json"
             
-            if not account_file.exists():
+            try:
+                mtime_ns = account_file.stat().st_mtime_ns
+            except OSError:
                 print("[INFO] account.json not found, using defaults")
                 return []
+
+            # Reuse the parsed file while it is unchanged on disk
+            cache_key = str(account_file)
+            cached = Setting_Window._account_cache.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                account_data = cached[1]
+            else:
+                account_data = _json_loads(account_file.read_bytes())
+                Setting_Window._account_cache[cache_key] = (mtime_ns, account_data)
             
-            with open(account_file, 'r', encoding='utf-8') as f:
-                account_data = json.load(f)
-            
+            # Widgets are only written when the value differs, so reloading an unchanged
+            # file does not emit textChanged / re-run on_provider_changed
+
             # Load provider if available
             provider = account_data.get("Provider", "")
             if provider and hasattr(self, 'controls') and "AI" in self.controls:
                 if "provider" in self.controls["AI"]:
-                    # Map internal provider names to display names
-                    provider_map = {
-                        "openrouter": "OpenRouter (Recommended)",
-                        "openai": "OpenAI (Official)",
-                        "qwen": "Alibaba Qwen (DashScope)",
-                        "deepseek": "DeepSeek (Official)",
-                        "xai": "X.AI (Grok)",
-                        "x.ai": "X.AI (Grok)",
-                        "groq": "Groq (Meta Llama/Mixtral)",
-                        "gemini": "Google Gemini (via OpenRouter)",
-                        "siliconflow": "SiliconFlow (硅基流动)",
-                        "ollama": "Ollama (Localhost)",
-                        "arli": "Arli"
-                    }
-                    display_name = provider_map.get(provider.lower(), "Custom")
-                    self.controls["AI"]["provider"].setCurrentText(display_name)
+                    display_name = _PROVIDER_DISPLAY_MAP.get(provider.casefold(), "Custom")
+                    provider_combo = self.controls["AI"]["provider"]
+                    if provider_combo.currentText() != display_name:
+                        provider_combo.setCurrentText(display_name)
                     print(f"[INFO] Loaded provider: {display_name}")
             
             # Load base_url if available
             base_url = account_data.get("base_url", "")
             if base_url and hasattr(self, 'controls') and "AI" in self.controls:
                 if "base_url" in self.controls["AI"]:
-                    self.controls["AI"]["base_url"].setText(base_url)
+                    base_url_input = self.controls["AI"]["base_url"]
+                    if base_url_input.text() != base_url:
+                        base_url_input.setText(base_url)
                     print(f"[INFO] Loaded base_url: {base_url}")
             
             # Load api_key if available
             api_key = account_data.get("API-Key", "")
             if api_key and hasattr(self, 'controls') and "AI" in self.controls:
                 if "api_key" in self.controls["AI"]:
-                    self.controls["AI"]["api_key"].setText(api_key)
+                    api_key_input = self.controls["AI"]["api_key"]
+                    if api_key_input.text() != api_key:
+                        api_key_input.setText(api_key)
                     print(f"[INFO] Loaded api_key: {'*' * min(8, len(api_key))}")
             
             # Get models list from the JSON file
@@ -403,29 +571,39 @@ class Setting_Window(QDialog):
         
         self.btn_test_connection.setEnabled(False)
         self.btn_test_connection.setText("Testing...")
-        
+
+        # Post asynchronously so the dialog stays responsive while waiting
+        if self._nam is None:
+            self._nam = QNetworkAccessManager(self)
+
+        request = QNetworkRequest(QUrl(base_url))
+        request.setRawHeader(b"Authorization", f"Bearer {api_key}".encode())
+        request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
+        data = {
+            "model": self.controls["AI"]["model"].currentText(),
+            "messages": [{"role": "user", "content": "test"}],
+            "max_tokens": 5
+        }
+
+        reply = self._nam.post(request, json.dumps(data).encode())
+        reply.finished.connect(lambda: self.on_test_connection_finished(reply))
+        QTimer.singleShot(10000, reply, reply.abort)
+
+    def on_test_connection_finished(self, reply):
+        """Report the result of the test request started by test_ai_connection."""
         try:
-            # Simple test request
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            }
-            data = {
-                "model": self.controls["AI"]["model"].currentText(),
-                "messages": [{"role": "user", "content": "test"}],
-                "max_tokens": 5
-            }
-            
-            response = requests.post(base_url, headers=headers, json=data, timeout=10)
-            
-            if response.status_code == 200:
+            status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+            if status_code == 200:
                 QMessageBox.information(self, "Success", "✓ Connection successful!")
-            else:
+            elif status_code is not None:
+                body = bytes(reply.readAll()).decode("utf-8", errors="replace")
                 QMessageBox.warning(self, "Connection Failed", 
-                    f"Status Code: {response.status_code}\n{response.text[:200]}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Connection error:\n{str(e)}")
+                    f"Status Code: {status_code}\n{body[:200]}")
+            else:
+                error = "Request timed out" if reply.error() == QNetworkReply.NetworkError.OperationCanceledError else reply.errorString()
+                QMessageBox.critical(self, "Error", f"Connection error:\n{error}")
         finally:
+            reply.deleteLater()
             self.btn_test_connection.setEnabled(True)
             self.btn_test_connection.setText("Test Connection")
     #-------------------------------------------------------------------------------------
@@ -446,16 +624,16 @@ class Setting_Window(QDialog):
         self.lbl_theme_mode = QLabel("Theme mode:")
         mode_combo = QComboBox()
         mode_combo.addItems(["Light"])
-        mode_combo.setCurrentText(self.settings.value("Appearance/theme", "Light"))
+        mode_combo.setCurrentText(self._sval("Appearance/theme", "Light"))
         mode_combo.currentTextChanged.connect(lambda theme: self.theme_changed.emit(theme))
         self.controls["Appearance"]["theme"] = mode_combo
         
         self.chk_toolbar_icons = QCheckBox("Show toolbar icons")
-        self.chk_toolbar_icons.setChecked(self.settings.value("Appearance/toolbar_icons", True, type=bool))
+        self.chk_toolbar_icons.setChecked(self._sval("Appearance/toolbar_icons", True, type=bool))
         self.controls["Appearance"]["toolbar_icons"] = self.chk_toolbar_icons
 
         self.chk_animations = QCheckBox("Enable panel animations")
-        self.chk_animations.setChecked(self.settings.value("Appearance/animations", True, type=bool))
+        self.chk_animations.setChecked(self._sval("Appearance/animations", True, type=bool))
         self.controls["Appearance"]["animations"] = self.chk_animations
 
         form.addRow(self.lbl_theme_mode, mode_combo)
@@ -471,14 +649,14 @@ class Setting_Window(QDialog):
         left_width_spin = QSpinBox()
         left_width_spin.setRange(200, 600)
         left_width_spin.setSingleStep(10)
-        left_width_spin.setValue(self.settings.value("Appearance/left_panel_width", 320, type=int))
+        left_width_spin.setValue(self._sval("Appearance/left_panel_width", 320, type=int))
         self.controls["Appearance"]["left_panel_width"] = left_width_spin
         
         self.lbl_right_width = QLabel("Right Panel Width:")
         right_width_spin = QSpinBox()
         right_width_spin.setRange(250, 800)
         right_width_spin.setSingleStep(10)
-        right_width_spin.setValue(self.settings.value("Appearance/right_panel_width", 400, type=int))
+        right_width_spin.setValue(self._sval("Appearance/right_panel_width", 400, type=int))
         self.controls["Appearance"]["right_panel_width"] = right_width_spin
         
         panel_layout.addRow(self.lbl_left_width, left_width_spin)
@@ -494,7 +672,7 @@ class Setting_Window(QDialog):
         self.bg_path_input = QLineEdit()
         self.bg_path_input.setPlaceholderText("No image selected (Default)")
         self.bg_path_input.setReadOnly(True)
-        saved_bg = self.settings.value("Appearance/central_background", "")
+        saved_bg = self._sval("Appearance/central_background", "")
         self.bg_path_input.setText(saved_bg)
         self.controls["Appearance"]["central_background"] = self.bg_path_input
 
@@ -541,17 +719,22 @@ class Setting_Window(QDialog):
         # --- Font Type ---
         self.lbl_font_type = QLabel("Font type:")
         font_combo = QComboBox()
+
+        # Collapse bursts of combo changes (arrow keys, scrolling) into one preview update
+        self._font_preview_timer = QTimer(self)
+        self._font_preview_timer.setSingleShot(True)
+        self._font_preview_timer.setInterval(50)
+        self._font_preview_timer.timeout.connect(self.update_font_preview)
         
-        font_list = [
-            "Arial", "Calibri", "Times New Roman", "Courier New", 
-            "Microsoft YaHei", "SimHei", "SimSun", 
-            "KaiTi", "FangSong", 
-            "STHeiti", "STKaiti", "STSong", "STFangsong", "PingFang SC"
-        ]
-        font_combo.addItems(font_list)
-        saved_font = self.settings.value("Font/type", "Microsoft YaHei")
+        font_names = list(_available_fonts())
+        saved_font = self._sval("Font/type", "Microsoft YaHei")
+        # Keep the stored font selectable even when it is not installed here,
+        # so saving other settings does not silently replace it
+        if saved_font and saved_font not in font_names:
+            font_names.append(saved_font)
+        font_combo.addItems(font_names)
         font_combo.setCurrentText(saved_font)
-        font_combo.currentTextChanged.connect(self.update_font_preview)
+        font_combo.currentTextChanged.connect(lambda _: self._font_preview_timer.start())
         font_layout.addWidget(self.lbl_font_type)
         font_layout.addWidget(font_combo)
         self.controls["Font"]["type"] = font_combo
@@ -559,10 +742,10 @@ class Setting_Window(QDialog):
         # --- Font Size ---
         self.lbl_font_size = QLabel("Font size:")
         size_combo = QComboBox()
-        size_combo.addItems([str(s) for s in range(8, 30)])
-        saved_size = self.settings.value("Font/size", "10")
+        size_combo.addItems(list(_FONT_SIZES))
+        saved_size = self._sval("Font/size", "10")
         size_combo.setCurrentText(saved_size)
-        size_combo.currentTextChanged.connect(self.update_font_preview)
+        size_combo.currentTextChanged.connect(lambda _: self._font_preview_timer.start())
         font_layout.addWidget(self.lbl_font_size)
         font_layout.addWidget(size_combo)
         self.controls["Font"]["size"] = size_combo
@@ -606,7 +789,7 @@ class Setting_Window(QDialog):
         self.lbl_lang_type = QLabel("Language type:")
         language_combo = QComboBox()
         language_combo.addItems(["English", "Chinese"])
-        saved_lang = self.settings.value("Language/type", "English")
+        saved_lang = self._sval("Language/type", "English")
         language_combo.setCurrentText(saved_lang)
         language_combo.currentTextChanged.connect(lambda lang: self.language_changed.emit(lang))
         lang_layout.addWidget(self.lbl_lang_type)
@@ -641,7 +824,7 @@ class Setting_Window(QDialog):
         baidu_radio = QRadioButton("Baidu")
         google_radio = QRadioButton("Google")
         
-        if self.settings.value("Search/Google", False, type=bool):
+        if self._sval("Search/Google", False, type=bool):
             google_radio.setChecked(True)
         else:
             baidu_radio.setChecked(True)
@@ -678,7 +861,7 @@ class Setting_Window(QDialog):
         self.lbl_curve_style = QLabel("Curve Style:")
         curve_combo = QComboBox()
         curve_combo.addItems(["Solid", "Dashed", "Dotted"])
-        curve_combo.setCurrentText(self.settings.value("ResultChart/curve_style", "Solid"))
+        curve_combo.setCurrentText(self._sval("ResultChart/curve_style", "Solid"))
         chart_layout.addRow(self.lbl_curve_style, curve_combo)
         self.controls["ResultChart"]["curve_style"] = curve_combo
 
@@ -686,27 +869,14 @@ class Setting_Window(QDialog):
         self.lbl_curve_color = QLabel("Curve Color:")
         curve_color_combo = QComboBox()
         
-        self.color_presets = [
-            ("Dark Blue", "#1F4788"),
-            ("Navy Blue", "#000080"),
-            ("Red", "#FF0000"),
-            ("Green", "#00AA00"),
-            ("Black", "#000000"),
-            ("Purple", "#800080"),
-            ("Orange", "#FF8C00"),
-            ("Cyan", "#00FFFF"),
-            ("Dark Gray", "#404040"),
-            ("Brown", "#8B4513"),
-        ]
+        self.color_presets = _CURVE_COLOR_PRESETS
         
-        for color_name, color_hex in self.color_presets:
-            curve_color_combo.addItem(color_name, color_hex)
+        self.fill_color_combo(curve_color_combo, self.color_presets)
         
-        saved_curve_color = self.settings.value("ResultChart/curve_color", "#1F4788")
-        for i, (name, hex_val) in enumerate(self.color_presets):
-            if hex_val == saved_curve_color:
-                curve_color_combo.setCurrentIndex(i)
-                break
+        saved_curve_color = self._sval("ResultChart/curve_color", "#1F4788")
+        idx = _CURVE_COLOR_INDEX.get(saved_curve_color)
+        if idx is not None:
+            curve_color_combo.setCurrentIndex(idx)
         
         self.setup_color_combo_display(curve_color_combo)
         chart_layout.addRow(self.lbl_curve_color, curve_color_combo)
@@ -715,9 +885,9 @@ class Setting_Window(QDialog):
         # --- Curve Width ---
         self.lbl_curve_width = QLabel("Curve Width:")
         curve_width_combo = QComboBox()
-        curve_width_combo.addItems(["1.0", "1.5", "2.0", "2.5", "3.0", "3.5", "4.0", "4.5", "5.0"])
-        saved_width = self.settings.value("ResultChart/curve_width", "2.0")
-        if saved_width in ["1.0", "1.5", "2.0", "2.5", "3.0", "3.5", "4.0", "4.5", "5.0"]:
+        curve_width_combo.addItems(list(_CURVE_WIDTHS))
+        saved_width = self._sval("ResultChart/curve_width", "2.0")
+        if saved_width in _CURVE_WIDTH_SET:
             curve_width_combo.setCurrentText(saved_width)
         else:
             curve_width_combo.setCurrentText("2.0")
@@ -728,7 +898,7 @@ class Setting_Window(QDialog):
         self.lbl_scatter_style = QLabel("Scatter Style:")
         scatter_combo = QComboBox()
         scatter_combo.addItems(["Circle", "Square", "Triangle"])
-        scatter_combo.setCurrentText(self.settings.value("ResultChart/scatter_style", "Circle"))
+        scatter_combo.setCurrentText(self._sval("ResultChart/scatter_style", "Circle"))
         chart_layout.addRow(self.lbl_scatter_style, scatter_combo)
         self.controls["ResultChart"]["scatter_style"] = scatter_combo
 
@@ -736,7 +906,7 @@ class Setting_Window(QDialog):
         self.lbl_axis_style = QLabel("Axis Style:")
         axis_combo = QComboBox()
         axis_combo.addItems(["Solid", "Dashed", "Dotted"])
-        axis_combo.setCurrentText(self.settings.value("ResultChart/axis_style", "Solid"))
+        axis_combo.setCurrentText(self._sval("ResultChart/axis_style", "Solid"))
         chart_layout.addRow(self.lbl_axis_style, axis_combo)
         self.controls["ResultChart"]["axis_style"] = axis_combo
 
@@ -744,7 +914,7 @@ class Setting_Window(QDialog):
         self.lbl_grid_style = QLabel("Grid Style:")
         grid_combo = QComboBox()
         grid_combo.addItems(["Solid", "Dashed", "Dotted"])
-        grid_combo.setCurrentText(self.settings.value("ResultChart/grid_style", "Solid"))
+        grid_combo.setCurrentText(self._sval("ResultChart/grid_style", "Solid"))
         chart_layout.addRow(self.lbl_grid_style, grid_combo)
         self.controls["ResultChart"]["grid_style"] = grid_combo
 
@@ -752,27 +922,14 @@ class Setting_Window(QDialog):
         self.lbl_bg_color = QLabel("Background Color:")
         bg_color_combo = QComboBox()
         
-        self.bg_color_presets = [
-            ("White", "#FFFFFF"),
-            ("Light Gray", "#FAFAFA"),
-            ("Light Blue", "#F0F8FF"),
-            ("Light Green", "#F0FFF0"),
-            ("Cream", "#FFFDD0"),
-            ("Snow", "#FFFAFA"),
-            ("Ghost White", "#F8F8FF"),
-            ("Light Yellow", "#FFFFE0"),
-            ("Off White", "#FAF0E6"),
-            ("Honeydew", "#F0FFF0"),
-        ]
+        self.bg_color_presets = _BG_COLOR_PRESETS
         
-        for color_name, color_hex in self.bg_color_presets:
-            bg_color_combo.addItem(color_name, color_hex)
+        self.fill_color_combo(bg_color_combo, self.bg_color_presets)
         
-        saved_bg_color = self.settings.value("ResultChart/bg_color", "#FAFAFA")
-        for i, (name, hex_val) in enumerate(self.bg_color_presets):
-            if hex_val == saved_bg_color:
-                bg_color_combo.setCurrentIndex(i)
-                break
+        saved_bg_color = self._sval("ResultChart/bg_color", "#FAFAFA")
+        idx = _BG_COLOR_INDEX.get(saved_bg_color)
+        if idx is not None:
+            bg_color_combo.setCurrentIndex(idx)
         
         self.setup_color_combo_display(bg_color_combo)
         chart_layout.addRow(self.lbl_bg_color, bg_color_combo)
@@ -794,19 +951,24 @@ class Setting_Window(QDialog):
         layout.addStretch()
         return page
 
+    def fill_color_combo(self, combo_box, presets):
+        """Fill a color combo from (name, hex) presets with one model swap instead of N inserts."""
+        model = QStandardItemModel(len(presets), 1, combo_box)
+        for row, (color_name, color_hex) in enumerate(presets):
+            item = QStandardItem(color_name)
+            item.setData(color_hex, Qt.ItemDataRole.UserRole)
+            model.setItem(row, item)
+        combo_box.setModel(model)
+
     def setup_color_combo_display(self, combo_box):
         """Setup color combo box to display color preview."""
         def update_color_display():
             hex_color = combo_box.currentData()
-            if hex_color:
-                combo_box.setStyleSheet(f"""
-                    QComboBox {{
-                        background-color: {hex_color};
-                        color: {'#000000' if hex_color in ['#FFFFFF', '#FFFDD0', '#FFFAFA', '#F8F8FF', '#FFFFE0', '#FAF0E6', '#F0FFF0'] else '#FFFFFF'};
-                        padding: 2px;
-                        border-radius: 3px;
-                    }}
-                """)
+            # Only re-style when the color really changes; each setStyleSheet re-polishes
+            if hex_color and hex_color != combo_box.property("preview_color"):
+                combo_box.setProperty("preview_color", hex_color)
+                text_color = '#000000' if hex_color in _LIGHT_COLORS else '#FFFFFF'
+                combo_box.setStyleSheet(_COLOR_COMBO_STYLE.format(bg=hex_color, fg=text_color))
         
         combo_box.currentIndexChanged.connect(update_color_display)
         update_color_display()
@@ -817,18 +979,11 @@ class Setting_Window(QDialog):
             self, "Export Chart Settings", "", "JSON Files (*.json)"
         )
         if file_path:
-            settings = {
-                "curve_style": self.controls["ResultChart"]["curve_style"].currentText(),
-                "curve_color": self.controls["ResultChart"]["curve_color"].currentData(),
-                "curve_width": self.controls["ResultChart"]["curve_width"].currentText(),
-                "scatter_style": self.controls["ResultChart"]["scatter_style"].currentText(),
-                "axis_style": self.controls["ResultChart"]["axis_style"].currentText(),
-                "grid_style": self.controls["ResultChart"]["grid_style"].currentText(),
-                "bg_color": self.controls["ResultChart"]["bg_color"].currentData()
-            }
+            chart = self.controls["ResultChart"]
+            settings = {key: getattr(chart[key], accessor)() for key, accessor in _CHART_EXPORT_FIELDS}
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(settings, f, indent=2)
+                with open(file_path, 'wb') as f:
+                    f.write(_json_dumps_indented(settings))
                 QMessageBox.information(self, "Success", "Chart settings exported successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export settings:\n{str(e)}")
@@ -840,52 +995,93 @@ class Setting_Window(QDialog):
         )
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    settings = json.load(f)
+                with open(file_path, 'rb') as f:
+                    settings = _json_loads(f.read())
                 
                 # Apply imported settings
-                if "curve_style" in settings:
-                    self.controls["ResultChart"]["curve_style"].setCurrentText(settings["curve_style"])
-                if "curve_width" in settings:
-                    self.controls["ResultChart"]["curve_width"].setCurrentText(settings["curve_width"])
-                if "scatter_style" in settings:
-                    self.controls["ResultChart"]["scatter_style"].setCurrentText(settings["scatter_style"])
-                if "axis_style" in settings:
-                    self.controls["ResultChart"]["axis_style"].setCurrentText(settings["axis_style"])
-                if "grid_style" in settings:
-                    self.controls["ResultChart"]["grid_style"].setCurrentText(settings["grid_style"])
+                chart = self.controls["ResultChart"]
+                for key in _CHART_TEXT_FIELDS:
+                    if key in settings:
+                        chart[key].setCurrentText(settings[key])
+
+                # Colors are stored as hex; select the matching preset
+                for key, hex_index in (("curve_color", _CURVE_COLOR_INDEX), ("bg_color", _BG_COLOR_INDEX)):
+                    idx = hex_index.get(settings.get(key))
+                    if idx is not None:
+                        chart[key].setCurrentIndex(idx)
                 
                 QMessageBox.information(self, "Success", "Chart settings imported successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to import settings:\n{str(e)}")
     #-------------------------------------------------------------------------------------
 
+    #-------------------------------------------------------------------------------------
+    # Cached settings access
+    def _reload_settings_cache(self):
+        self._settings_cache = {key: self.settings.value(key) for key in self.settings.allKeys()}
+
+    def _sval(self, key, default=None, type=None):
+        """Read a value from the settings snapshot, coercing like QSettings.value(type=...)."""
+        value = self._settings_cache.get(key, default)
+        if type is None or value is None:
+            return value
+        if type is bool and isinstance(value, str):
+            return value.lower() in ("true", "1")
+        try:
+            return type(value)
+        except (TypeError, ValueError):
+            return default
+
+    def _write_group(self, group, values):
+        """Write the values that differ from the snapshot under one settings group.
+
+        Returns True when at least one value was written.
+        """
+        changed = {}
+        for name, value in values.items():
+            key = f"{group}/{name}"
+            if key not in self._settings_cache or self._sval(key, type=type(value)) != value:
+                changed[name] = value
+        if not changed:
+            return False
+
+        self.settings.beginGroup(group)
+        for name, value in changed.items():
+            self.settings.setValue(name, value)
+            self._settings_cache[f"{group}/{name}"] = value
+        self.settings.endGroup()
+        return True
+
     #-------------------------------------------------------------------------------------
     # Change the current page
-    def change_page(self, current, previous):
-        if not current: return
-        
-        if current == self.item_ai:
-            self.stack.setCurrentWidget(self.ai_page)
-        elif current == self.item_appearance:
-            self.stack.setCurrentWidget(self.appearance_page)
-        elif current == self.item_font:
-            self.stack.setCurrentWidget(self.font_page)
-        elif current == self.item_language:
-            self.stack.setCurrentWidget(self.language_page)
-        elif current == self.item_search:
-            self.stack.setCurrentWidget(self.search_page)
-        elif current == self.item_result_chart:
-            self.stack.setCurrentWidget(self.result_chart_page)
+    def change_page(self, row):
+        if row < 0: return
+
+        self.ensure_page(row)
+        self.stack.setCurrentIndex(row)
+
+    def ensure_page(self, row):
+        """Return the page for a navigation row, swapping out its placeholder on first use."""
+        page = self._built_pages.get(row)
+        if page is None:
+            page = self._page_builders[row]()
+            placeholder = self.stack.widget(row)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stack.insertWidget(row, page)
+            self._built_pages[row] = page
+        return page
 
     #-------------------------------------------------------------------------------------
     # Validate settings before saving
-    def validate_settings(self):
+    def read_connection_fields(self):
+        """Return the stripped (api_key, base_url) currently entered on the AI page."""
+        ai = self.controls["AI"]
+        return ai["api_key"].text().strip(), ai["base_url"].text().strip()
+
+    def validate_settings(self, api_key, base_url):
         """Validate all settings before saving."""
         # Validate AI settings
-        api_key = self.controls["AI"]["api_key"].text().strip()
-        base_url = self.controls["AI"]["base_url"].text().strip()
-        
         if api_key and not base_url:
             QMessageBox.warning(self, "Validation Error", "Base URL is required when API Key is provided.")
             return False
@@ -900,77 +1096,98 @@ class Setting_Window(QDialog):
     # Apply settings without closing
     def apply(self):
         """Apply settings without closing the dialog."""
-        if not self.validate_settings():
+        api_key, base_url = self.read_connection_fields()
+        if not self.validate_settings(api_key, base_url):
             return
         
-        self.save_all_settings()
+        self.save_all_settings(api_key, base_url)
         self.apply_settings_signal.emit()
+        # The status bar reports the result; no modal confirmation needed
         self.settings_page_operation_signal.emit("Settings applied successfully!")
-        QMessageBox.information(self, "Applied", "Settings have been applied.")
 
 
     #-------------------------------------------------------------------------------------
     # Save all settings
-    def save_all_settings(self):
-        """Save all settings to file."""
+    def save_all_settings(self, api_key, base_url):
+        """Save all settings to file (api_key / base_url come already stripped from validation)."""
+        # The main window may have written keys since the dialog was built
+        self._reload_settings_cache()
+
         # AI settings
         ai = self.controls["AI"]
-        self.settings.setValue("AI/provider", ai["provider"].currentText())
-        self.settings.setValue("AI/model", ai["model"].currentText())
-        self.settings.setValue("AI/base_url", ai["base_url"].text().strip())
-        self.settings.setValue("AI/api_key", ai["api_key"].text().strip())
-        self.settings.setValue("AI/system_prompt", ai["system_prompt"].toPlainText().strip())
-        self.settings.setValue("AI/temperature", ai["temperature"].value() / 10.0)
+        ai_changed = self._write_group("AI", {
+            "provider": ai["provider"].currentText(),
+            "model": ai["model"].currentText(),
+            "base_url": base_url,
+            "api_key": api_key,
+            "system_prompt": ai["system_prompt"].toPlainText().strip(),
+            "temperature": ai["temperature"].value() / 10.0,
+        })
         
-        # Appearance settings
-        self.settings.setValue("Appearance/theme", self.controls["Appearance"]["theme"].currentText())
-        self.settings.setValue("Appearance/toolbar_icons", self.controls["Appearance"]["toolbar_icons"].isChecked())
-        self.settings.setValue("Appearance/animations", self.controls["Appearance"]["animations"].isChecked())
-        self.settings.setValue("Appearance/left_panel_width", self.controls["Appearance"]["left_panel_width"].value())
-        self.settings.setValue("Appearance/right_panel_width", self.controls["Appearance"]["right_panel_width"].value())
-        self.settings.setValue("Appearance/central_background", self.controls["Appearance"]["central_background"].text())
+        # Appearance settings (pages that were never opened hold no edits)
+        appearance = self.controls["Appearance"]
+        if appearance:
+            self._write_group("Appearance", {
+                "theme": appearance["theme"].currentText(),
+                "toolbar_icons": appearance["toolbar_icons"].isChecked(),
+                "animations": appearance["animations"].isChecked(),
+                "left_panel_width": appearance["left_panel_width"].value(),
+                "right_panel_width": appearance["right_panel_width"].value(),
+                "central_background": appearance["central_background"].text(),
+            })
 
         # Font settings
-        font_type = self.controls["Font"]["type"].currentText()
-        font_size = self.controls["Font"]["size"].currentText()
-        self.settings.setValue("Font/type", font_type)
-        self.settings.setValue("Font/size", font_size)
-        self.font_changed.emit(font_type, int(font_size))
+        font = self.controls["Font"]
+        if font:
+            font_type = font["type"].currentText()
+            font_size = font["size"].currentText()
+            # Re-applying a font relayouts the whole UI, so only announce real changes
+            if self._write_group("Font", {"type": font_type, "size": font_size}):
+                self.font_changed.emit(font_type, int(font_size))
 
         # Language settings
-        self.settings.setValue("Language/type", self.controls["Language"]["type"].currentText())
+        language = self.controls["Language"]
+        if language:
+            self._write_group("Language", {"type": language["type"].currentText()})
 
         # Search settings
-        self.settings.setValue("Search/Baidu", self.controls["Search"]["Baidu"].isChecked())
-        self.settings.setValue("Search/Google", self.controls["Search"]["Google"].isChecked())
+        search = self.controls["Search"]
+        if search:
+            self._write_group("Search", {
+                "Baidu": search["Baidu"].isChecked(),
+                "Google": search["Google"].isChecked(),
+            })
 
         # Result chart settings
         result_chart = self.controls["ResultChart"]
-        self.settings.setValue("ResultChart/curve_style", result_chart["curve_style"].currentText())
-        self.settings.setValue("ResultChart/curve_color", result_chart["curve_color"].currentData())
-        self.settings.setValue("ResultChart/curve_width", result_chart["curve_width"].currentText())
-        self.settings.setValue("ResultChart/scatter_style", result_chart["scatter_style"].currentText())
-        self.settings.setValue("ResultChart/axis_style", result_chart["axis_style"].currentText())
-        self.settings.setValue("ResultChart/grid_style", result_chart["grid_style"].currentText())
-        self.settings.setValue("ResultChart/bg_color", result_chart["bg_color"].currentData())
-
-        self.settings.sync()
-        self.ai_settings_changed.emit()
+        if result_chart:
+            self._write_group("ResultChart", {
+                "curve_style": result_chart["curve_style"].currentText(),
+                "curve_color": result_chart["curve_color"].currentData(),
+                "curve_width": result_chart["curve_width"].currentText(),
+                "scatter_style": result_chart["scatter_style"].currentText(),
+                "axis_style": result_chart["axis_style"].currentText(),
+                "grid_style": result_chart["grid_style"].currentText(),
+                "bg_color": result_chart["bg_color"].currentData(),
+            })
+
+        # The file itself is flushed once when the dialog closes (see __init__)
+        if ai_changed:
+            self.ai_settings_changed.emit()
 
     #-------------------------------------------------------------------------------------
     # Accept and save
     def accept(self):
         """Save all settings to file (without applying to UI or closing dialog)."""
-        if not self.validate_settings():
+        api_key, base_url = self.read_connection_fields()
+        if not self.validate_settings(api_key, base_url):
             return
         
         # Save settings to file only (no UI changes)
-        self.save_all_settings()
+        self.save_all_settings(api_key, base_url)
+        # The status bar reports the result; no modal confirmation needed
         self.settings_page_operation_signal.emit("Settings saved to file successfully!")
-        
-        # Show confirmation message
-        QMessageBox.information(self, "Saved", "Settings have been saved to file.\nClick 'Apply' to apply them immediately.")
-        
+
         # Do NOT close dialog - let user continue editing
         # Do NOT call super().accept()
     #-------------------------------------------------------------------------------------
@@ -1003,12 +1220,12 @@ class Setting_Window(QDialog):
         if not lang_manager: return
         
         self.setWindowTitle(lang_manager.get_text("Preferences"))
-        self.item_ai.setText(0, lang_manager.get_text("AI Configuration"))
-        self.item_appearance.setText(0, lang_manager.get_text("Appearance"))
-        self.item_font.setText(0, lang_manager.get_text("Font Settings"))
-        self.item_language.setText(0, lang_manager.get_text("Language Settings"))
-        self.item_search.setText(0, lang_manager.get_text("Search"))
-        self.item_result_chart.setText(0, lang_manager.get_text("Result Chart"))
+        self.item_ai.setText(lang_manager.get_text("AI Configuration"))
+        self.item_appearance.setText(lang_manager.get_text("Appearance"))
+        self.item_font.setText(lang_manager.get_text("Font Settings"))
+        self.item_language.setText(lang_manager.get_text("Language Settings"))
+        self.item_search.setText(lang_manager.get_text("Search"))
+        self.item_result_chart.setText(lang_manager.get_text("Result Chart"))
 
         self.button_box.button(QDialogButtonBox.Ok).setText(lang_manager.get_text("Save"))
         self.button_box.button(QDialogButtonBox.Apply).setText(lang_manager.get_text("Apply"))
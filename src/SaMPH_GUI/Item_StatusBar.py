@@ -10,14 +10,17 @@ import os
 import time
 import json
 import socket
-import threading
-from urllib.request import urlopen
+from http.client import HTTPException
+from urllib.request import Request, urlopen
+from urllib.error import URLError
 
 from PySide6.QtWidgets import (
     QStatusBar, QLabel, QWidget, QHBoxLayout, QFrame
 )
-from PySide6.QtCore import QTimer, QDateTime, Qt, Signal, QObject, QSize
-from PySide6.QtGui import QIcon, QFont
+from PySide6.QtCore import (
+    QTimer, QDateTime, Qt, Slot, QSettings, QRunnable, QThreadPool, QMetaObject, Q_ARG
+)
+from PySide6.QtGui import QPixmap, QFont
 
 
 #-------------------------------------------------------------- 
@@ -32,28 +35,59 @@ if __name__ == "__main__":
 # Import utils from the folder Utils
 from SaMPH_Utils.Utils import utils 
 
+# The host name does not change while the app runs; look it up once
+_COMPUTER_NAME = socket.gethostname()
+
 
 #-------------------------------------------------------------- 
-class LocationWorker(QObject):
+class LocationWorker(QRunnable):
 
     """
-    Worker to fetch location in a separate thread
+    Pool task that fetches the location and hands it back to the status bar
+    on the GUI thread through a queued update_location call
     """
-    finished = Signal(str)
+
+    UNAVAILABLE = "Location Unavailable"
+
+    def __init__(self, status_bar):
+        super().__init__()
+        self._status_bar = status_bar
+
+    def run(self):
+        location = self.fetch_location()
+        try:
+            QMetaObject.invokeMethod(
+                self._status_bar, "update_location",
+                Qt.ConnectionType.QueuedConnection, Q_ARG(str, location)
+            )
+        except RuntimeError:
+            # The status bar was destroyed while the request was in flight
+            pass
 
     def fetch_location(self):
+        # Use ip-api.com for geolocation (free for non-commercial use)
+        request = Request(
+            "http://ip-api.com/json/",
+            headers={"Connection": "close", "User-Agent": "SaMPH/1.0"}
+        )
         try:
-            # Use ip-api.com for geolocation (free for non-commercial use)
-            response = urlopen("http://ip-api.com/json/", timeout=5)
-            data = json.loads(response.read().decode('utf-8'))
-            if data['status'] == 'success':
-                location = f"{data['city']}, {data['country']}"
-                self.finished.emit(location)
-            else:
-                self.finished.emit("Location Unavailable")
-        except Exception as e:
-            # print(f"Location fetch error: {e}")
-            self.finished.emit("Location Unavailable")
+            # Short timeout: offline machines fail fast instead of holding the thread
+            with urlopen(request, timeout=2) as response:
+                data = json.loads(response.read(4096))
+        except (URLError, HTTPException, socket.timeout, ConnectionError):
+            # HTTPException covers IncompleteRead, BadStatusLine, ...
+            return self.UNAVAILABLE
+        except ValueError:
+            # Malformed or truncated JSON body
+            return self.UNAVAILABLE
+
+        if not isinstance(data, dict) or data.get('status') != 'success':
+            return self.UNAVAILABLE
+
+        city, country = data.get('city'), data.get('country')
+        if not city or not country:
+            return self.UNAVAILABLE
+        return f"{city}, {country}"
 #-------------------------------------------------------------- 
 
 
@@ -68,11 +102,29 @@ class StatusBarBuilder(QStatusBar):
     - Geolocation with custom icon
     """
 
+    # Icon files, resolved once
+    COMPUTER_ICON_PATH = utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-desktop-100.png")
+    LOCATION_ICON_PATH = utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-location-100.png")
+
+    # Decoded status icons keyed by (path, size), shared by all instances
+    _PIXMAP_CACHE = {}
+
+    # Reuse the last looked-up location for a day before asking ip-api.com again
+    LOCATION_TTL = 24 * 3600
+
     #----------------------------------------------------------
     def __init__(self, parent=None):
         super().__init__(parent)
+
+        settings_path = utils.get_global_usr_dir() / "Settings/settings.ini"
+        self.settings = QSettings(str(settings_path), QSettings.Format.IniFormat)
         
-        self.start_time = time.time()
+        # Monotonic clock: runtime is unaffected by wall-clock adjustments
+        self.start_time = time.monotonic()
+        self._last_time_text = ""
+        self._minute_prefix = ""
+        self._last_minute_key = -1
+        self._last_runtime_text = ""
         
         self.init_ui()
         self.start_timers()
@@ -103,7 +155,15 @@ class StatusBarBuilder(QStatusBar):
                 font-size: 12px;
                 background: transparent;
             }
+            QLabel#StatusIcon, QLabel#StatusText {
+                padding: 0;
+            }
+            QLabel#StatusHostName {
+                font-weight: bold;
+                padding: 0;
+            }
         """)
+        # The child labels below are styled by object name from this one sheet
         
         # ============ Left Side: Computer Name ============
         self.computer_widget = QWidget()
@@ -113,11 +173,10 @@ class StatusBarBuilder(QStatusBar):
         
         # Custom Computer Icon
         self.comp_icon_label = QLabel()
-        self.comp_icon_label.setStyleSheet("padding: 0;") # Reset padding for icon
+        self.comp_icon_label.setObjectName("StatusIcon")
         # Try to load icon
-        comp_icon_path = utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-desktop-100.png")
-        if os.path.exists(comp_icon_path):
-            pixmap = QIcon(comp_icon_path).pixmap(QSize(16, 16))
+        pixmap = self._get_pixmap(self.COMPUTER_ICON_PATH, 16)
+        if pixmap is not None:
             self.comp_icon_label.setPixmap(pixmap)
         else:
             self.comp_icon_label.setText("🖥️") # Fallback
@@ -125,9 +184,8 @@ class StatusBarBuilder(QStatusBar):
         comp_layout.addWidget(self.comp_icon_label)
         
         # Computer Name Text
-        computer_name = socket.gethostname()
-        self.comp_text_label = QLabel(computer_name)
-        self.comp_text_label.setStyleSheet("font-weight: bold; padding: 0;")
+        self.comp_text_label = QLabel(_COMPUTER_NAME)
+        self.comp_text_label.setObjectName("StatusHostName")
         comp_layout.addWidget(self.comp_text_label)
         
         self.addWidget(self.computer_widget)
@@ -150,11 +208,10 @@ class StatusBarBuilder(QStatusBar):
         
         # Custom Location Icon
         self.loc_icon_label = QLabel()
-        self.loc_icon_label.setStyleSheet("padding: 0;")
+        self.loc_icon_label.setObjectName("StatusIcon")
         
-        loc_icon_path = utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-location-100.png")
-        if os.path.exists(loc_icon_path):
-            pixmap = QIcon(loc_icon_path).pixmap(QSize(16, 16))
+        pixmap = self._get_pixmap(self.LOCATION_ICON_PATH, 16)
+        if pixmap is not None:
             self.loc_icon_label.setPixmap(pixmap)
         else:
             self.loc_icon_label.setText("📍")
@@ -162,13 +219,29 @@ class StatusBarBuilder(QStatusBar):
         loc_layout.addWidget(self.loc_icon_label)
         
         self.loc_text_label = QLabel("Locating...")
-        self.loc_text_label.setStyleSheet("padding: 0;")
+        self.loc_text_label.setObjectName("StatusText")
         loc_layout.addWidget(self.loc_text_label)
         
         self.addPermanentWidget(self.location_widget)
     #----------------------------------------------------------
 
 
+    #----------------------------------------------------------
+    @classmethod
+    def _get_pixmap(cls, path, size):
+        """Return a cached size x size pixmap for path, or None if the file is missing"""
+        key = (str(path), size)
+        if key not in cls._PIXMAP_CACHE:
+            pixmap = None
+            if os.path.exists(path):
+                pixmap = QPixmap(str(path)).scaled(
+                    size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+                )
+            cls._PIXMAP_CACHE[key] = pixmap
+        return cls._PIXMAP_CACHE[key]
+    #----------------------------------------------------------
+
+
     #----------------------------------------------------------
     def start_timers(self):
         """Start timers for updating time and runtime"""
@@ -184,33 +257,51 @@ class StatusBarBuilder(QStatusBar):
     #----------------------------------------------------------
     def update_status(self):
         """Update time and runtime labels"""
-        # Update Local Time
-        current_time = QDateTime.currentDateTime()
-        self.time_label.setText(current_time.toString("yyyy-MM-dd HH:mm:ss"))
+        # Labels are only touched when their text changes, so a late tick repaints nothing
+        # Update Local Time ("yyyy-MM-dd HH:mm" is formatted once per minute, seconds appended)
+        now = QDateTime.currentDateTime()
+        minute_key = now.toSecsSinceEpoch() // 60
+        if minute_key != self._last_minute_key:
+            self._last_minute_key = minute_key
+            self._minute_prefix = now.toString("yyyy-MM-dd HH:mm")
+        time_text = f"{self._minute_prefix}:{now.time().second():02d}"
+        if time_text != self._last_time_text:
+            self._last_time_text = time_text
+            self.time_label.setText(time_text)
         
         # Update Runtime
-        elapsed = int(time.time() - self.start_time)
-        hours = elapsed // 3600
-        minutes = (elapsed % 3600) // 60
-        seconds = elapsed % 60
-        self.runtime_label.setText(f"Runtime: {hours:02d}:{minutes:02d}:{seconds:02d}")
+        elapsed = int(time.monotonic() - self.start_time)
+        hours, rem = divmod(elapsed, 3600)
+        minutes, seconds = divmod(rem, 60)
+        runtime_text = f"Runtime: {hours:02d}:{minutes:02d}:{seconds:02d}"
+        if runtime_text != self._last_runtime_text:
+            self._last_runtime_text = runtime_text
+            self.runtime_label.setText(runtime_text)
     #----------------------------------------------------------
 
 
     #---------------------------------------------------------- 
     def get_location(self):
         """Fetch location asynchronously"""
-        self.worker = LocationWorker()
-        self.worker.finished.connect(self.update_location)
-        
-        # Run in a separate thread to avoid freezing UI
-        threading.Thread(target=self.worker.fetch_location, daemon=True).start()
+        cached = self.settings.value("StatusBar/location", "")
+        cached_at = self.settings.value("StatusBar/location_ts", 0, type=int)
+        if cached and time.time() - cached_at < self.LOCATION_TTL:
+            self.loc_text_label.setText(cached)
+            return
+
+        # Run on a pooled thread to avoid freezing UI
+        QThreadPool.globalInstance().start(LocationWorker(self))
     #----------------------------------------------------------     
 
     #----------------------------------------------------------
+    @Slot(str)
     def update_location(self, location):
         """Update location label"""
         self.loc_text_label.setText(location)
+
+        if location != LocationWorker.UNAVAILABLE:
+            self.settings.setValue("StatusBar/location", location)
+            self.settings.setValue("StatusBar/location_ts", int(time.time()))
     #----------------------------------------------------------
 
     #----------------------------------------------------------
@@ -17,7 +17,7 @@ from PySide6.QtWidgets import (
     QMessageBox
 )
 from PySide6.QtGui import QPixmap, QFont, QIcon, QAction, QPainter              # Import classes for images, fonts, and icons
-from PySide6.QtCore import Qt, QSize, QDateTime, Signal                         # Import Qt core functionalities such as alignment
+from PySide6.QtCore import Qt, QSize, QDateTime, Signal, QTimer                 # Import Qt core functionalities such as alignment
 #-----------------------------------------------------------------------------------------
 
 #-----------------------------------------------------------------------------------------
@@ -28,9 +28,33 @@ from SaMPH_Utils.Utils import utils                                # Import util
 # from Input_Data_Page import InputPageContinuous, InputPageDiscrete
 # from Log_Windows import LogWindow
 
+#-----------------------------------------------------------------------------------------
+# Toolbar icons: short name -> resource path relative to the package
+_ICON_TABLE = {
+    "home":      "SaMPH_Images/WIN11-Icons/icons8-home.svg",
+    "home_off":  "SaMPH_Images/WIN11-Icons/icons8-home-deactive.svg",
+    "left":      "SaMPH_Images/WIN11-Icons/icons8-dashboard-layout-100.png",
+    "left_off":  "SaMPH_Images/WIN11-Icons/icons8-dashboard-layout-deactive-100.png",
+    "log":       "SaMPH_Images/WIN11-Icons/icons8-log-100.png",
+    "log_off":   "SaMPH_Images/WIN11-Icons/icons8-log-deactive-100.png",
+    "right":     "SaMPH_Images/WIN11-Icons/icons8-claude-ai-100.png",
+    "right_off": "SaMPH_Images/WIN11-Icons/icons8-claude-ai-deactive-100.png",
+    "calculate": "SaMPH_Images/WIN11-Icons/icons8-play-100.png",
+    "clear":     "SaMPH_Images/WIN11-Icons/icons8-clear-100.png",
+    "report":    "SaMPH_Images/WIN11-Icons/icons8-pdf-100.png",
+    "google":    "SaMPH_Images/WIN11-Icons/icons8-google-100.png",
+    "website":   "SaMPH_Images/WIN11-Icons/icons8-website-100.png",
+}
+
+# Absolute icon paths, resolved once by ToolbarBuilder._ensure_icons()
+_ICON = {}
+
 #-----------------------------------------------------------------------------------------
 class ToolbarBuilder(QToolBar):
 
+    # Panel toggles; each has a "<name>" (shown) and "<name>_off" (hidden) icon
+    _TOGGLE_NAMES = ("home", "left", "log", "right")
+
     # Define signals for external connections
     search_requested = Signal(str)                    # Search requested signal (str)   
     toggle_home_requested = Signal(bool)              # Toggle home requested signal
@@ -55,9 +79,27 @@ class ToolbarBuilder(QToolBar):
         # Get the main window instance which has been created before tool bar creation
         self.main_window = parent  
 
+        self._ensure_icons()
+
         self.toolbar_style()
 
         self.create_tool_bar()
+
+        # Search box and preferences are not needed for the first paint;
+        # build them on the next event-loop tick
+        QTimer.singleShot(0, self._create_search_and_prefs)
+    #-------------------------------------------------------------------------------------
+
+
+    #-------------------------------------------------------------------------------------
+    @classmethod
+    def _ensure_icons(cls):
+        """Resolve every toolbar icon path once per process."""
+        if not _ICON:
+            _ICON.update(
+                (name, utils.local_resource_path(rel_path))
+                for name, rel_path in _ICON_TABLE.items()
+            )
     #-------------------------------------------------------------------------------------
 
 
@@ -81,11 +123,22 @@ class ToolbarBuilder(QToolBar):
         self.addSeparator()
 
 
+        # --------------------------------------------------------------------------------
+        # Build both toggle icon states once; the QIcons are kept on the instance
+        # so toggling a panel only swaps icons instead of reloading files
+        self._icons = {
+            name: {
+                True:  QIcon(_ICON[name]),
+                False: QIcon(_ICON[name + "_off"]),
+            }
+            for name in self._TOGGLE_NAMES
+        }
+
         # --------------------------------------------------------------------------------
         # Panel Toggle Actions (VS Code style)
         # Toggle Central home page
         self.action_toggle_home = QAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-home.svg")), 
+            self._icons["home"][True], 
             "Toggle Home", 
             self
         )
@@ -96,7 +149,7 @@ class ToolbarBuilder(QToolBar):
 
         # Toggle Left Panel
         self.action_toggle_left = QAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/Win11-Icons/icons8-dashboard-layout-100.png")), 
+            self._icons["left"][True], 
             "Toggle Navigation", 
             self
         )
@@ -108,7 +161,7 @@ class ToolbarBuilder(QToolBar):
 
         # Toggle Log Window
         self.action_toggle_log = QAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/Win11-Icons/icons8-log-100.png")), 
+            self._icons["log"][True], 
             "Toggle Log", 
             self
         )
@@ -119,7 +172,7 @@ class ToolbarBuilder(QToolBar):
         
         # Toggle Right Panel
         self.action_toggle_right = QAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/Win11-Icons/icons8-claude-ai-100.png")), 
+            self._icons["right"][True], 
             "Toggle AI Chat", 
             self
         )
@@ -141,7 +194,7 @@ class ToolbarBuilder(QToolBar):
         # Calculation Controls
         # Calculate/Stop button (toggleable)
         self.action_calculate = QAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-play-100.png")), 
+            QIcon(_ICON["calculate"]), 
             "Calculate", 
             self
         )
@@ -152,7 +205,7 @@ class ToolbarBuilder(QToolBar):
         
         # Clear button
         self.action_clear = QAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-clear-100.png")), 
+            QIcon(_ICON["clear"]), 
             "Clear", 
             self
         )
@@ -162,7 +215,7 @@ class ToolbarBuilder(QToolBar):
 
         # Output report buttion
         self.action_output_report = QAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/WIN11-Icons/icons8-pdf-100.png")), 
+            QIcon(_ICON["report"]), 
             "Output Report", 
             self
         )
@@ -170,6 +223,14 @@ class ToolbarBuilder(QToolBar):
         self.addAction(self.action_output_report)
         # --------------------------------------------------------------------------------
 
+    #-------------------------------------------------------------------------------------
+
+
+    #-------------------------------------------------------------------------------------
+    def _create_search_and_prefs(self):
+
+        """Add the preferences action and the search box (deferred from __init__)."""
+
         self.addSeparator()
 
         # Check the status of the action and set the icon accordingly
@@ -199,7 +260,7 @@ class ToolbarBuilder(QToolBar):
         
         # Add magnifying glass icon on the left
         self.search_input.addAction(
-            QIcon(utils.local_resource_path("SaMPH_Images/Win11-Icons/icons8-Google-100.png")),
+            QIcon(_ICON["google"]),
             QLineEdit.LeadingPosition
         )
         
@@ -207,7 +268,7 @@ class ToolbarBuilder(QToolBar):
 
         # Search button
         self.search_button = QPushButton()
-        self.search_button.setIcon(QIcon(utils.local_resource_path("SaMPH_Images/Win11-Icons/icons8-website-100.png")))
+        self.search_button.setIcon(QIcon(_ICON["website"]))
         self.search_button.setIconSize(QSize(26, 26))
         self.search_button.setFixedWidth(28)   # Compact width for icon-only button
         self.search_button.setFixedHeight(28)  # Match QLineEdit height
@@ -230,6 +291,11 @@ class ToolbarBuilder(QToolBar):
         search_layout.addWidget(self.search_button)
         self.addWidget(self.search_container)
 
+        # A language switch may have run before these widgets existed
+        lang_manager = getattr(self.main_window, "language_manager", None)
+        if lang_manager:
+            self.update_ui_texts(lang_manager)
+
     #-------------------------------------------------------------------------------------
 
 
@@ -258,20 +324,16 @@ class ToolbarBuilder(QToolBar):
     #-------------------------------------------------------------------------------------
     # Icon update helpers
     def update_home_icon(self, checked):
-        icon_path = "SaMPH_Images/WIN11-Icons/icons8-home.svg" if checked else "SaMPH_Images/WIN11-Icons/icons8-home-deactive.svg"
-        self.action_toggle_home.setIcon(QIcon(utils.local_resource_path(icon_path)))
+        self.action_toggle_home.setIcon(self._icons["home"][bool(checked)])
 
     def update_left_icon(self, checked):
-        icon_path = "SaMPH_Images/WIN11-Icons/icons8-dashboard-layout-100.png" if checked else "SaMPH_Images/WIN11-Icons/icons8-dashboard-layout-deactive-100.png"
-        self.action_toggle_left.setIcon(QIcon(utils.local_resource_path(icon_path)))
+        self.action_toggle_left.setIcon(self._icons["left"][bool(checked)])
 
     def update_log_icon(self, checked):
-        icon_path = "SaMPH_Images/WIN11-Icons/icons8-log-100.png" if checked else "SaMPH_Images/WIN11-Icons/icons8-log-deactive-100.png"
-        self.action_toggle_log.setIcon(QIcon(utils.local_resource_path(icon_path)))
+        self.action_toggle_log.setIcon(self._icons["log"][bool(checked)])
 
     def update_right_icon(self, checked):
-        icon_path = "SaMPH_Images/WIN11-Icons/icons8-claude-ai-100.png" if checked else "SaMPH_Images/WIN11-Icons/icons8-claude-ai-deactive-100.png"
-        self.action_toggle_right.setIcon(QIcon(utils.local_resource_path(icon_path)))
+        self.action_toggle_right.setIcon(self._icons["right"][bool(checked)])
 
     #-------------------------------------------------------------------------------------
     # Emit methods (called by button click)
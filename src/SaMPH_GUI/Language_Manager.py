@@ -55,14 +55,16 @@ class Language_Manager:
         if not os.path.exists(file_path):
             print(f"[WARN] Missing translation file: {file_path}")
             self.translations = {"English": {}, "Chinese": {}}
-            return
+        else:
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    self.translations = json.load(f)
+            except Exception as e:
+                print(f"[ERROR] Failed to load translation file: {e}")
+                self.translations = {"English": {}, "Chinese": {}}
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                self.translations = json.load(f)
-        except Exception as e:
-            print(f"[ERROR] Failed to load translation file: {e}")
-            self.translations = {"English": {}, "Chinese": {}}
+        # Translation table of the current language, used by get_text()
+        self._table = self.translations.get(self.language, {})
 
     #-------------------------------------------------------------------------------------
     def set_language(self, lang):
@@ -74,14 +76,15 @@ class Language_Manager:
         else:
             self.language = "English"
 
+        self._table = self.translations.get(self.language, {})
+
     #-------------------------------------------------------------------------------------
     def get_text(self, key):
         """
         Get translated text for given key.
         If missing, return the key itself as fallback.
         """
-        print(f"Language: {self.language}, Key: {key}")
-        return self.translations.get(self.language, {}).get(key, key)
+        return self._table.get(key, key)
 
     #-------------------------------------------------------------------------------------
     def get_current_language(self):
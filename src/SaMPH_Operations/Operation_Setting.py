@@ -113,7 +113,7 @@ class SettingPage_Operations(QObject):
         # ---------------- Font Settings ----------------
         self.apply_font_change(
             settings.value("Font/type", "Microsoft YaHei"),
-            int(settings.value("Font/size", "10"))
+            settings.value("Font/size", 10, type=int)
         )
 
         # ---------------- Appearance / Theme ----------------
@@ -213,7 +213,7 @@ class SettingPage_Operations(QObject):
         if self.main_window:
             self.main_window.setStyleSheet(light_qss)
         if self.setting_page:
-            self.setting_page.setStyleSheet(light_qss)
+            self.setting_page.set_theme_stylesheet(light_qss)
 
         print(f"[INFO] Theme applied: Light (Forced)")
 
@@ -395,8 +395,8 @@ class SettingPage_Operations(QObject):
 
             # Update temperature
             if "temperature" in ai_ctrls:
-                saved_temp = float(settings.value("AI/temperature", 0.7))
-                ai_ctrls["temperature"].setValue(int(saved_temp * 10))
+                saved_temp = settings.value("AI/temperature", 0.7, type=float)
+                ai_ctrls["temperature"].setValue(round(saved_temp * 10))
 
         print("[INFO] AI settings applied")
     
@@ -60,6 +60,8 @@ if not getattr(sys, 'frozen', False):  # Only log in dev mode
 try:
     import matplotlib
     import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     import latex2mathml.converter
     RENDERING_AVAILABLE = True
     
@@ -423,9 +425,12 @@ class utils:
         clean_latex = f"${latex_str}$"
         safe_width_px = max(max_width_px, 100)
         
+        # Figures are built directly on an Agg canvas instead of through pyplot:
+        # this runs on render pool threads, and pyplot's figure manager is global state
         try:
             # Measure text size
-            temp_fig = plt.figure(figsize=(10, 1), dpi=dpi)
+            temp_fig = Figure(figsize=(10, 1), dpi=dpi)
+            FigureCanvasAgg(temp_fig)
             temp_ax = temp_fig.add_axes([0, 0, 1, 1])
             temp_ax.set_axis_off()
             temp_text = temp_ax.text(
@@ -444,14 +449,13 @@ class utils:
                 logging.error(f"Failed to measure LaTeX bounds for '{latex_str}': {e}")
                 logging.error(traceback.format_exc())
                 w_in, h_in = 4, 0.5
-            finally:
-                plt.close(temp_fig)
 
             final_w = max(min(w_in, safe_width_px / dpi), 0.1)
             final_h = max(h_in, 0.1)
             
             # Render final image
-            fig = plt.figure(figsize=(final_w, final_h), dpi=dpi)
+            fig = Figure(figsize=(final_w, final_h), dpi=dpi)
+            FigureCanvasAgg(fig)
             fig.text(
                 0.5, 0.5, clean_latex, 
                 fontsize=font_size, 
@@ -469,7 +473,6 @@ class utils:
                 bbox_inches='tight', 
                 pad_inches=0.02
             )
-            plt.close(fig)
             buf.seek(0)
             img = base64.b64encode(buf.read()).decode('utf-8')
             
@@ -496,10 +499,6 @@ class utils:
             logging.error(traceback.format_exc())
             logging.error(f"LaTeX string: {latex_str}")
             logging.error(f"Frozen: {getattr(sys, 'frozen', False)}")
-            try:
-                plt.close('all')
-            except:
-                pass
             return "[Error]"
     #--------------------------------------------------------------
 